@@ -71,6 +71,91 @@
 #              0031      - Added getContactListFromSip() function, that reads through sip.conf file, in getting the
 #                          needed parameters of the account on that file. The parameters are then appeneded to contactListData
 #                          having a combination of users from users.conf and sip.conf. (Mohd Danial Hariz Bin Norazam)
+#              0032      - Replace python xml.etree.ElementTree with lxml C library (fallback to cElementTree) for
+#                          XML load and write process. Prettify XML file via lxml C serializer (writeXml()).
+#              0033      - Stream the XML files during daemon load via iterparse, and release each processed record
+#                          from memory (clearXml()).
+#              0034      - Retrieve call recording date, time and extensions involved by splitting the file name,
+#                          instead of going through each char of the file name.
+#              0035      - Get each call recording file date and time once before sorting the recording file list.
+#              0036      - Retrieve intercom extensions type, number and location by splitting the category name,
+#                          instead of going through each char of the category name.
+#              0037      - Hand over audio recording file that need to be deleted to the delete thread via a queue
+#                          (deleteQueue). Delete thread remove the file directly via os.unlink() without polling.
+#              0038      - Combine reading process for all XML files during daemon load into a single function
+#                          (loadXmlList()), and read each XML file concurrently via its own thread (loadXmlData()).
+#              0039      - Remove python dictionary dummy data for extensions/contact list, SIP WebRTC contact list
+#                          and intercom list. Each list now start empty and every record are appended.
+#              0040      - Add extension number lookup index for extensions/contact list and SIP WebRTC contact list
+#                          (contactListIdx, webRtcContListIdx) during REST API PUT request.
+#              0041      - Retrieve call recording data and construct the recording XML file in a single pass through
+#                          the recording file list.
+#              0042      - Port the daemon to python 3. XML file are written with XML declaration and UTF-8 encoding.
+#              0043      - Delete recording file REST API request remove the file directly via os.unlink(), instead of
+#                          running 'rm -r' shell command. Remove unused delete recording file logic comments.
+#              0044      - Serialize the prettified XML file contents in a single call and write it once, the
+#                          prettify function (indent) only used when lxml library not exist.
+#              0045      - Get the recording file name and its date and time in a single pass through the recording
+#                          folder (os.scandir), instead of listing the recording folder twice.
+#              0046      - Only parse asterisk extensions.conf for intercom list when its modification time change, and
+#                          add extension number lookup index for intercom list (intercomListIdx).
+#              0047      - Keep the parsed asterisk config file (users.conf, sip.conf and extensions.conf), and only
+#                          parse the config file again when its modification time change.
+#              0048      - Remove unnecessary global declaration for read only global variable.
+#              0049      - Add macro option for prettify XML file (PRETTY). XML file are written without prettify
+#                          by default, since its only read by dispatcher web client.
+#              0050      - Lookup existing extensions/contact list and SIP WebRTC contact list data via its extension
+#                          number lookup index during get contact list.
+#              0051      - Construct each XML record for contact, intercom and SIP WebRTC list in a single loop, remove
+#                          first record flag (firstContactXml). Write extensions/contact list XML file once after all
+#                          records are inserted during REST API PUT request.
+#              0052      - Insert python dictionary data to the XML file via a single function (insertXmlList()), driven
+#                          by the same XML element tag list used during XML file read process.
+#              0053      - Retrieve extensions type from the extensions full name via string partition and slicing,
+#                          instead of going through each character.
+#              0054      - Only parse asterisk users.conf and sip.conf for extensions/contact list and SIP WebRTC contact
+#                          list when its modification time change (contactListMtime, webRtcContListMtime).
+#              0055      - Keep extensions/contact list XML file structure (contactListXml), and only update the requested
+#                          extension IP address record during REST API PUT request.
+#              0056      - Only handle XML file write error during get contact list and intercom list, other errors
+#                          are no longer silently ignored.
+#              0057      - Write XML file contents at once for both lxml and python ElementTree library.
+#              0058      - Delete recording file REST API request only accept the file name, to avoid deleting a file
+#                          outside recordings folder.
+#              0059      - Add list updated status data lookup index by type (listUpdtIdx).
+#              0060      - Parse asterisk users.conf and sip.conf via python configparser, and get each extensions
+#                          item directly by its name.
+#              0061      - Retrieve each extensions data from asterisk users.conf once for each config file changes
+#                          (parseUsersConfig()).
+#              0062      - Construct each XML record by copying a record element template when lxml library exist.
+#              0063      - Add a single log print function (logInfo()) for logger or normal print statement, selected
+#                          once during daemon load. Log message are formatted by the logger.
+#              0064      - Add Cross-Origin (CORS) response headers to each REST API response at once (corsHeaders).
+#              0065      - Write XML file to a temporary file first, then replace the XML file with it.
+#              0066      - Use a unique temporary file for each XML file write, concurrent write to the same XML file
+#                          no longer share the same temporary file.
+#              0067      - Keep SIP WebRTC contact list XML file structure (webRtcContListXml), and only update the
+#                          requested extension record during REST API PUT request.
+#              0068      - Add channel CALL status data lookup index by id (hangupIdx).
+#              0069      - Retrieve full dispatch call channel name from the first field of each asterisk channel list
+#                          line, instead of going through each character. Only terminate the channel which name
+#                          start with the request channel followed by '-' sign.
+#              0070      - Retrieve connected channel list and terminate dispatch call channel through a persistent
+#                          asterisk manager interface (AMI) connection when AMI account exist in the settings (amiuser,
+#                          amisecret), instead of execute asterisk command for each request.
+#              0071      - Execute asterisk command via a single function (runAstCommand()), detect asterisk command
+#                          error from its exit status and error output.
+#              0072      - Write extensions/contact list and SIP WebRTC contact list XML file during REST API PUT
+#                          request via write XML file thread (xmlWriteQueue), REST API reply without waiting for the
+#                          XML file write. Multiple update on the same XML file are written once.
+#              0073      - Add macro arguments via HANGUPSERVER_ARGS environment variable, for running RestFul API web
+#                          server under WSGI server (gunicorn).
+#              0074      - REST API request errors are logged instead of silently ignored. Only handle expected
+#                          errors during XML file read/write and thread creation.
+#              0075      - Select XML files and call recording files folder location once during daemon load.
+#              0076      - Build request call channel name prefix once before searching the connected channel list.
+#              0077      - Strip asterisk config file comment and leading whitespace from each users.conf and sip.conf
+#                          line before parse, same as asterisk. Support '=>' item value separator.
 #
 #              ----------------------------------------------------------------------------------------------   
 # Author : Ahmad Bahari Nizam B. Abu Bakar, Mohd Danial Hariz Bin Norazam
@@ -86,6 +171,11 @@
 # Version  1.1.8 - Add feature item [0024,0025,0026,0027]
 # Version  1.1.9 - Add feature item [0029,0030]
 # Version  1.1.10 - Add feature item [0031]
+# Version  1.2.1 - Add feature item [0032,0033,0034,0035,0036,0037,0038,0039,
+#                  0040,0041,0042,0043,0044,0045,0046,0047,0048,
+#                  0049,0050,0051,0052,0053,0054,0055,0056,0057,0058,
+#                  0059,0060,0061,0062,0063,0064,0065,0066,0067,0068,
+#                  0069,0070,0071,0072,0073,0074,0075,0076,0077]
 #
 # Date   : 29/01/2020 (INITIAL RELEASE DATE)
 #          UPDATED - 18/04/2020 - 1.1.1
@@ -98,6 +188,7 @@
 #          UPDATED - 21/11/2021 - 1.1.8
 #          UPDATED - 26/11/2021 - 1.1.9
 #          UPDATED - 24/02/2023 - 1.1.10
+#          UPDATED - 15/10/2026 - 1.2.1
 #
 #############################################################################################################
 
@@ -105,15 +196,27 @@ import logging
 import logging.handlers
 import sys
 import os
+import re
 import signal
-import time
-import thread
+import threading
+import queue
 import subprocess
-import glob
+import socket
+import functools
+import configparser
+import copy
+import tempfile
 
-import xml.etree.ElementTree as ET
 import asterisk.config
 
+# XML library, use lxml (libxml2) C library if exist, otherwise fallback to C accelerated ElementTree
+try:
+    from lxml import etree as ET
+    haveLxml = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    haveLxml = False
+
 # REST API library
 from flask import Flask
 from flask import jsonify
@@ -122,11 +225,14 @@ from flask import request
 # Import settings
 from settings import totalrecordings
 
-app = Flask(__name__)
+# Import optional asterisk manager interface (AMI) account settings, use asterisk CLI command if not exist
+try:
+    from settings import amiuser, amisecret
+except ImportError:
+    amiuser = None
+    amisecret = None
 
-# String manipulation
-def mid(s, offset, amount):
-    return s[offset - 1:offset + amount - 1]
+app = Flask(__name__)
 
 # Prettify pass xml object
 def indent(elem, level=0):
@@ -143,34 +249,169 @@ def indent(elem, level=0):
     else:
         if level and (not elem.tail or not elem.tail.strip()):
             elem.tail = i
+
+# Serialize pass xml object to the xml file contents
+# Only prettify the xml structure when PRETTY macro are enabled
+def serializeXml(elem):
+    # lxml prettify the xml structure inside its C serializer, without touching the tree
+    if haveLxml == True:
+        xmlData = ET.tostring(elem, pretty_print=prettyXml, xml_declaration=True, encoding='utf-8')
+    else:
+        # Arrange/prettify the xml structure
+        if prettyXml == True:
+            # Python 3.9 and above provide its own prettify function
+            if hasattr(ET, 'indent'):
+                ET.indent(elem)
+            else:
+                indent(elem)
+        xmlData = ET.tostring(elem, xml_declaration=True, encoding='utf-8')
+
+    return xmlData
+
+# Write pass xml file contents to the given xml file
+def writeXmlData(xmlData, xmlFile):
+    # Write the whole xml file contents at once to a unique temporary file inside the same folder, then
+    # replace the xml file with it. Web client will only read either the previous or the new complete xml file
+    xmlFd, xmlTmpFile = tempfile.mkstemp(dir=os.path.dirname(xmlFile) or '.', prefix=os.path.basename(xmlFile) + '.',
+                                         suffix='.tmp')
+    try:
+        with os.fdopen(xmlFd, 'wb') as xmlOut:
+            xmlOut.write(xmlData)
+        # Temporary file are only readable by its owner, web server need to read the xml file
+        os.chmod(xmlTmpFile, 0o644)
+        os.replace(xmlTmpFile, xmlFile)
+    except:
+        os.unlink(xmlTmpFile)
+        raise
+
+# Write pass xml object to the given xml file
+def writeXml(elem, xmlFile):
+    writeXmlData(serializeXml(elem), xmlFile)
+
+# Queue the given xml file to be written by XML file write thread, xml object are retrieved via the pass
+# function during the write, so a queued xml file is always written with its latest xml object contents
+# MUST be called while holding xmlLock, the xml object MUST only be built, updated and written while holding xmlLock
+def queueXmlWrite(getElem, xmlFile):
+    if xmlFile not in xmlWritePending:
+        xmlWritePending.add(xmlFile)
+        xmlWriteQueue.put((getElem, xmlFile))
+
+# Parse pass asterisk config file, parsed config are kept for each file and its modification time
+@functools.lru_cache(maxsize=8)
+def parseAstConfig(cnfgFile, cnfgMtime):
+    return asterisk.config.Config(cnfgFile)
+
+# Get parsed asterisk config file, only parse again when the config file change
+def loadAstConfig(cnfgFile):
+    return parseAstConfig(cnfgFile, os.stat(cnfgFile).st_mtime_ns)
+
+# Asterisk config file comment, start from any ';' which is not escaped ('\;') until end of line
+astCommentRe = re.compile(r'(?<!\\);.*')
+
+# Parse pass asterisk config file with only [category] and item=value lines (users.conf, sip.conf)
+# Parsed config are kept for each file and its modification time
+@functools.lru_cache(maxsize=8)
+def parseIniConfig(cnfgFile, cnfgMtime):
+    cnfg = configparser.RawConfigParser(delimiters=('=>', '='), comment_prefixes=('#',), strict=False,
+                                        allow_no_value=True)
+    # Follow asterisk config file line rules before pass it to configparser, strip the comment and leading
+    # whitespace from each line (asterisk never continue a value to the next indented line)
+    with open(cnfgFile) as cnfgIn:
+        cnfg.read_file(astCommentRe.sub('', cnfgLine).strip().replace('\\;', ';') for cnfgLine in cnfgIn)
+    return cnfg
+
+# Get parsed asterisk config file with only item=value lines, only parse again when the config file change
+def loadIniConfig(cnfgFile):
+    return parseIniConfig(cnfgFile, os.stat(cnfgFile).st_mtime_ns)
+
+# Retrieve each extensions number, full name, type and secret from pass asterisk users.conf
+# Extensions data are kept for each file and its modification time
+@functools.lru_cache(maxsize=2)
+def parseUsersConfig(cnfgFile, cnfgMtime):
+    usersCnfg = parseIniConfig(cnfgFile, cnfgMtime)
+    usersData = []
+
+    for category in usersCnfg.sections():
+        if category != 'general':
+            # Get the extension full name
+            extName = usersCnfg.get(category, 'fullname', fallback=None) or ''
+            # Get the extension type from the extension full name
+            # Sample data format: 6001 NORMAL:Bilik_A -> NORMAL
+            extType = extName.partition(' ')[2].partition(':')[0]
+            # Get extension secret or sip password
+            extSecret = usersCnfg.get(category, 'secret', fallback=None) or ''
+            usersData.append((category, extName, extType, extSecret))
+
+    return tuple(usersData)
+
+# Get extensions data from asterisk users.conf, only retrieve again when the config file change
+def loadUsersConfig(cnfgFile):
+    return parseUsersConfig(cnfgFile, os.stat(cnfgFile).st_mtime_ns)
+
+# Get pass config files modification time, return None when any of the config file NOT exist
+def getCnfgMtime(*cnfgFiles):
+    try:
+        return tuple(os.stat(cnfgFile).st_mtime_ns for cnfgFile in cnfgFiles)
+    except OSError:
+        return None
+
+# Release pass xml element and its processed siblings during iterparse
+def clearXml(elem):
+    elem.clear()
+    # lxml only, detach the previous processed siblings from its parent
+    if haveLxml == True:
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
             
 # Global variable declaration
 backLogger         = False    # Macro for logger
 secureInSecure     = False    # Macro for secure (https) or insecure (http) mode
 testxml            = False    # Macro for stored extensions/contact list folder location
-xmlTree            = ''       # XML parse from XML file
-xmlRoot            = ''       # XML root element from parse XML file
-firstDat           = False    # Python dictionary first data initialization
-deleteProc         = False    # Delete process flag
+prettyXml          = False    # Macro for prettify XML file
 recordFile         = []       # Call recording file name buffer
-fileNeedToDelete   = []       # File that need to be deleted buffer
 totRecordFile      = 0        # Total call recording file 
-fileToDeleteCnt    = 0        # Total file to delete counter
+deleteQueue        = queue.Queue() # Audio recording file that need to be deleted queue
+xmlWriteQueue      = queue.Queue() # XML file that need to be written queue
+xmlWritePending    = set()    # XML file already inside the write queue
+xmlLock            = threading.Lock() # XML file structure lock, between REST API request and XML file write thread
+amiAddr            = ('127.0.0.1', 5038) # Asterisk manager interface (AMI) address
+amiSock            = None     # Asterisk manager interface persistent connection
+amiFile            = None     # Asterisk manager interface connection reader
+amiActId           = 0        # Asterisk manager interface last action id
+amiLock            = threading.Lock() # Asterisk manager interface connection lock, one action at a time
 
 # Copy total audio recording files from settings that need to retain inside server
 totRetainRecFile   = totalrecordings  
 
 # Check for macro arguments
-if (len(sys.argv) > 1):
-    for x in sys.argv:
-        # Optional macro if we want to enable text file log
-        if x == "LOGGER":
-            backLogger = True
-        # Optional macro if we want to enable https
-        elif x == "SECURE":
-            secureInSecure = True
-        elif x == "XML":
-            testxml = True            
+# Macro arguments can also be pass via HANGUPSERVER_ARGS environment variable (space separated), for WSGI server
+# which own the command line arguments
+for x in sys.argv[1:] + os.environ.get('HANGUPSERVER_ARGS', '').split():
+    # Optional macro if we want to enable text file log
+    if x == "LOGGER":
+        backLogger = True
+    # Optional macro if we want to enable https
+    elif x == "SECURE":
+        secureInSecure = True
+    elif x == "XML":
+        testxml = True            
+    # Optional macro if we want human readable (prettify) XML file
+    elif x == "PRETTY":
+        prettyXml = True
+
+# XML files and call recording files folder location, selected once by XML macro
+# Actual stored folder location
+if testxml == True:
+    xmlDir    = "/var/www/html/"
+    recordDir = "/var/www/html/recordings/"
+# Test stored folder location
+else:
+    xmlDir    = ""
+    recordDir = "/home/bahari/MyWorks/Projects/MasuriPlus-VdgPlus/backup-masuri-plus-ipbx-13102021/monitor/"
+contactListXmlFile    = xmlDir + "listContact.xml"
+webRtcContListXmlFile = xmlDir + "registrarlist.xml"
+intercomListXmlFile   = xmlDir + "intercomlist.xml"
+recordListXmlFile     = xmlDir + "recordinglist.xml"
         
 # Setup log file
 if backLogger == True:
@@ -181,6 +422,13 @@ if backLogger == True:
     formatter = logging.Formatter('%(asctime)s %(levelname)-8s %(message)s')
     logger.addHandler(logfile)
 
+    # Write to logger, message are only formatted by the logger
+    logInfo = logger.info
+else:
+    # Print statement
+    def logInfo(msg, *args):
+        print(msg % args if args else msg)
+
 # Channel CALL status data
 hangupData=[
     {
@@ -189,6 +437,8 @@ hangupData=[
         'status' : 'TERMINATED'
     }
 ]
+# Channel CALL status data lookup index by id
+hangupIdx = { hgupData['id'] : hgupData for hgupData in hangupData }
 
 # List UPDATED status data
 listUpdtData=[
@@ -217,6 +467,8 @@ listUpdtData=[
         'fullname' : 'NA'
     }
 ]
+# List UPDATED status data lookup index by type
+listUpdtIdx = { updtData['type'] : updtData for updtData in listUpdtData }
 
 # Error during UPDATE
 updateFailed={
@@ -225,208 +477,137 @@ updateFailed={
 }
 
 # Normal contact list data
-contactListData=[
-    {
-        'ext' : '0000',
-        'fullname' : 'NA',
-        'type' : 'NA',
-        'ip' : 'NA'
-    }
-]
+contactListData=[]
+# Normal contact list data lookup index by extension number
+contactListIdx={}
+# Asterisk users.conf and sip.conf modification time for the current normal contact list data
+contactListMtime=None
+# Normal contact list xml file structure, and its record element lookup index by extension number
+contactListXml=None
+contactListXmlIdx={}
 
 # WebRTC contact list data
-webRtcContListData=[
-    {
-        'ext' : '0000',
-        'fullname' : 'NA',
-        'pswd' : 'NA',
-        'ip' : 'NA',
-        'sip' : 'NA',
-        'avail' : 'NA'
-    }
-]
+webRtcContListData=[]
+# WebRTC contact list data lookup index by extension number
+webRtcContListIdx={}
+# Asterisk users.conf modification time for the current WebRTC contact list data
+webRtcContListMtime=None
+# WebRTC contact list xml file structure, and its record element lookup index by extension number
+webRtcContListXml=None
+webRtcContListXmlIdx={}
 
 # Intercom contact list data
-intercomListData=[
-		{
-        'ext' : '0000',
-        'fullname' : 'NA',
-        'type' : 'NA',
-        'ip' : 'NA'
-    }
-]
+intercomListData=[]
+# Intercom contact list data lookup index by extension number
+intercomListIdx={}
+# Asterisk extensions.conf modification time for the current intercom contact list data
+intercomListMtime=None
+
+# XML element tag for each python dictionary data key, in XML file order
+# Element tag without python dictionary data key are written as NA
+# Normal and intercom extensions/contact list
+contactXmlFields = (('ip', 'IPADDR'), ('fullname', 'LOCATION'), ('ext', 'CALLID'), (None, 'SERVERID'),
+                    ('type', 'TYPE'))
+# SIP WebRTC contact list
+webRtcXmlFields = (('ip', 'IPADDR'), ('fullname', 'LOCATION'), ('avail', 'AVAIL'), ('ext', 'USERNAME'),
+                   ('sip', 'SIPADDR'), ('pswd', 'PSWD'))
 
-# Read XML files, and then update python dictionary data
-# Normal extensions/contact list
-try:
-    # Actual stored folder location
-    if testxml == True:
-        xmlTree = ET.parse("/var/www/html/listContact.xml")
-    # Test stored folder location
-    else:
-        xmlTree = ET.parse("listContact.xml")
-        
-    xmlRoot = xmlTree.getroot()
-    # Start get the data from XML file and arrange it to python dictionary array
-    for val in xmlRoot.findall('INFO'):
-        ipAddr = val.find('IPADDR').text
-        loc = val.find('LOCATION').text
-        callId = val.find('CALLID').text
-        typ = val.find('TYPE').text
-
-        # First data update
-        if firstDat == False:
-            extDB = [ extDBB for extDBB in contactListData ]
-            extDB[0]['ext'] = callId
-            extDB[0]['fullname'] = loc
-            extDB[0]['type'] = typ
-            extDB[0]['ip'] = ipAddr
-
-            firstDat = True
-        # New data update
-        else:
-            # Construct the new data
-            newData = {
-                        'ext':callId,
-                        'fullname':loc,
-                        'type':typ,
-                        'ip' : ipAddr
-                        }
-            # Append a NEW extension to the existing record
-            contactListData.append(newData)
-except:
-    # Write to logger
-    if backLogger == True:
-        logger.info("DEBUG_LD_XML: Open listContact.xml config file failed!")
-    # Print statement
-    else:
-        print "DEBUG_LD_XML: Open listContact.xml config file failed!"    
+# Read XML file, and then update python dictionary data
+def loadXmlList(xmlFile, recTag, xmlFields, listData):
+    try:
+        # Start stream the data from XML file and arrange it to python dictionary array
+        for event, val in ET.iterparse(xmlFile, events=('end',)):
+            # Only process a complete record element
+            if val.tag != recTag:
+                continue
 
-# Read XML files, and then update python dictionary data
-# SIP WebRTC contact list
-try:
-    firstDat = False
-    
-    # Actual stored folder location
-    if testxml == True:
-        xmlTree = ET.parse("/var/www/html/registrarlist.xml")
-    # Test stored folder location
-    else:
-        xmlTree = ET.parse("registrarlist.xml")
-		
-    xmlRoot = xmlTree.getroot()
-    # Start get the data from XML file and arrange it to python dictionary array
-    for val in xmlRoot.findall('SERVER'):
-        ipAddr = val.find('IPADDR').text
-        loc = val.find('LOCATION').text
-        avail = val.find('AVAIL').text
-        uname = val.find('USERNAME').text
-        sipAddr = val.find('SIPADDR').text
-        pswd = val.find('PSWD').text
-        
-        # First data update
-        if firstDat == False:
-            extDB = [ extDBB for extDBB in webRtcContListData ]
-            extDB[0]['ip'] = ipAddr
-            extDB[0]['fullname'] = loc
-            extDB[0]['ext'] = uname
-            extDB[0]['sip'] = sipAddr
-            extDB[0]['pswd'] = pswd
-            extDB[0]['avail'] = avail
-
-            firstDat = True
-        # New data update
-        else:
-            # Construct the new data
-            newData = {
-                        'ext' : uname,
-                        'fullname' : loc,
-                        'pswd' : pswd,
-                        'ip' : ipAddr,
-                        'sip' : sipAddr,
-                        'avail' : avail
-                        }
             # Append a NEW extension to the existing record
-            webRtcContListData.append(newData)
-except:
-    # Write to logger
-    if backLogger == True:
-        logger.info("DEBUG_LD_XML: Open registrarlist.xml config file failed!")
-    # Print statement
+            listData.append({ key : val.findtext(tag) for key, tag in xmlFields if key is not None })
+
+            # Release the processed record from memory
+            clearXml(val)
+    # XML file not exist, or invalid XML file
+    except (OSError, ET.ParseError) as err:
+        logInfo("DEBUG_LD_XML: Open %s config file failed! %s", os.path.basename(xmlFile), err)
+
+# Insert pass python dictionary data array to the xml file structure, one record element for each data
+# Return record element lookup index by extension number, only the first record is indexed for duplicate
+# extension number
+def insertXmlList(xmlRoot, recTag, xmlFields, listData):
+    xmlIdx = {}
+
+    # lxml copy a record element template inside its C library, faster than create each element
+    if haveLxml == True:
+        xmlTmpl = ET.Element(recTag)
+        for key, tag in xmlFields:
+            ET.SubElement(xmlTmpl, tag).text = 'NA'
+
+        for extData in listData:
+            xmlItems = copy.deepcopy(xmlTmpl)
+            for xmlItem, (key, tag) in zip(xmlItems, xmlFields):
+                if key is not None:
+                    xmlItem.text = extData[key]
+            xmlRoot.append(xmlItems)
+            xmlIdx.setdefault(extData['ext'], xmlItems)
     else:
-        print "DEBUG_LD_XML: Open registrarlist.xml config file failed!"
+        for extData in listData:
+            xmlItems = ET.SubElement(xmlRoot, recTag)
+            for key, tag in xmlFields:
+                ET.SubElement(xmlItems, tag).text = extData[key] if key is not None else 'NA'
+            xmlIdx.setdefault(extData['ext'], xmlItems)
+
+    return xmlIdx
+
+# Update pass record element text from its python dictionary data, without rebuild the whole xml file structure
+def updateXmlRecord(xmlItems, xmlFields, extData):
+    for xmlItem, (key, tag) in zip(xmlItems, xmlFields):
+        if key is not None:
+            xmlItem.text = extData[key]
+
+# Build extension number lookup index for pass python dictionary data array
+# Only the first record is indexed for duplicate extension number
+def indexList(listData):
+    listIdx = {}
+    for extData in listData:
+        listIdx.setdefault(extData['ext'], extData)
+    return listIdx
+
+# Read all XML files during daemon load, each XML file are read by its own thread
+def loadXmlData():
+    global contactListIdx
+    global webRtcContListIdx
+
+    loadThd = [
+        # Normal extensions/contact list
+        threading.Thread(target=loadXmlList, args=(contactListXmlFile, 'INFO', contactXmlFields, contactListData)),
+        # SIP WebRTC contact list
+        threading.Thread(target=loadXmlList, args=(webRtcContListXmlFile, 'SERVER', webRtcXmlFields, webRtcContListData)),
+        # Intercom contact list
+        threading.Thread(target=loadXmlList, args=(intercomListXmlFile, 'INFO', contactXmlFields, intercomListData))
+    ]
 
-# Read XML files, and then update python dictionary data
-# Intercom contact list
-try:
-    firstDat = False
+    # Start read the XML files, and wait until all XML files finished
+    for thd in loadThd:
+        thd.start()
+    for thd in loadThd:
+        thd.join()
 
-    # Actual stored folder location
-    if testxml == True:
-        xmlTree = ET.parse("/var/www/html/intercomlist.xml")
-    # Test stored folder location
-    else:
-        xmlTree = ET.parse("intercomlist.xml")
-
-    xmlRoot = xmlTree.getroot()
-    # Start get the data from XML file and arrange it to python dictionary array
-    for val in xmlRoot.findall('INFO'):
-        ipAddr = val.find('IPADDR').text
-        loc = val.find('LOCATION').text
-        callId = val.find('CALLID').text
-        typ = val.find('TYPE').text
-
-        # First data update
-        if firstDat == False:
-            extDB = [ extDBB for extDBB in intercomListData ]
-            extDB[0]['ext'] = callId
-            extDB[0]['fullname'] = loc
-            extDB[0]['type'] = typ
-            extDB[0]['ip'] = ipAddr
-
-            firstDat = True
-        # New data update
-        else:
-            # Construct the new data
-            newData = {
-                        'ext':callId,
-                        'fullname':loc,
-                        'type':typ,
-                        'ip' : ipAddr
-                        }
-            # Append a NEW extension to the existing record
-            intercomListData.append(newData)
-except:
-    # Write to logger
-    if backLogger == True:
-        logger.info("DEBUG_LD_XML: Open intercomlist.xml config file failed!")
-    # Print statement
-    else:
-        print "DEBUG_LD_XML: Open intercomlist.xml config file failed!"
+    # Build extensions/contact list lookup index
+    contactListIdx = indexList(contactListData)
+    webRtcContListIdx = indexList(webRtcContListData)
 
 # Retrieve current call recording file from folder
 # Then insert the recording file data to XML file
 def getRecordFile():
     global recordFile 
     global totRecordFile
-    global testxml
-    global totRetainRecFile
-    global fileNeedToDelete
-    global fileToDeleteCnt   
-    global deleteProc
     
     retResult = False
     fileName = ''
-    fileNameCnt = 0
-    tempDateTimeOfCall = ''
-    dateTimeOfCall = []
-    dashCnt = 0
-    tempExtInvol = ''
-    extInvol = []
-    arrayCnt = 0
-    dataSelect = 0
-    fileToDelete = ''
-    realTotRecFile = 0
+    fileData = []
+    fileList = []
+    # Total audio recording file need to be retain
+    retainRecFile = totRetainRecFile
 
     # For testing purposes
     #testxml = False
@@ -438,456 +619,257 @@ def getRecordFile():
     #                            02 - Time Of Call
     #                            03 - Extensions involved
     # Get the total recording file 
-    # Actual stored folder location
-    if testxml == True:
-        # Get the total record file inside selected folder
-        totRecordFile = len(glob.glob("/var/www/html/recordings/*.ogg"))
-        # Populate the file name inside selected folder
-        recordFile = glob.glob("/var/www/html/recordings/*.ogg")
-        # Start sorted recordfile based on the date and time - descending
-        recordFile = sorted(recordFile, key=lambda t: -os.stat(t).st_mtime)
-        # Get the file name without detail path - only the file name
-        recordFile = map(os.path.basename, recordFile)
-        
-    # For testing purposes
-    else:
-        # Get the total record file inside selected folder
-        totRecordFile = len(glob.glob("/home/bahari/MyWorks/Projects/MasuriPlus-VdgPlus/backup-masuri-plus-ipbx-13102021/monitor/*.ogg"))
-        # Populate the file name inside selected folder
-        recordFile = glob.glob("/home/bahari/MyWorks/Projects/MasuriPlus-VdgPlus/backup-masuri-plus-ipbx-13102021/monitor/*.ogg")
-        # Start sorted record file based on the date and time - descending
-        recordFile = sorted(recordFile, key=lambda t: -os.stat(t).st_mtime)
-        # Get the file name without detail path - only the file name
-        recordFile = map(os.path.basename, recordFile)
+    # Populate the file name and its date and time inside selected folder in a single pass
+    try:
+        with os.scandir(recordDir) as dirEntries:
+            for dirEntry in dirEntries:
+                try:
+                    # Only regular recording file, folder entry are ignored
+                    if dirEntry.name.endswith('.ogg') and dirEntry.is_file():
+                        fileList.append((dirEntry.stat().st_mtime, dirEntry.name))
+                # Recording file deleted during the scan, skip the file
+                except OSError:
+                    continue
+    # Recording folder NOT exist, treat as no recording file
+    except OSError:
+        fileList = []
+
+    # Start sorted record file based on file date and time - descending
+    fileList.sort(key=lambda t: t[0], reverse=True)
+    # Get the file name only
+    recordFile = [ t[1] for t in fileList ]
+    # Get the total record file inside selected folder
+    totRecordFile = len(recordFile)
     
     # Only execute when delete audio recording file process are not busy
-    if deleteProc == False:
-        # Go through the record file name inside folder
-        if totRecordFile > 0:
-            for a in range(totRecordFile):
-                fileName = recordFile[a] 
-                #fileNameCnt = len(fileName)
+    if deleteQueue.unfinished_tasks == 0:
+        # Start construct recording XML files
+        try:
+            xmlRecordRoot = ET.Element('RECORDING')
 
+            # Go through the record file name inside folder
+            for a, fileName in enumerate(recordFile):
                 # Audio recording file already exceed the limit
                 # Start delete the older recording file 
-                if a >= totRetainRecFile and fileName != '':
-                    # Set delete process flag
-                    deleteProc = True
-                    # Copy the audio recording file that need to be deleted to the buffer
-                    fileNeedToDelete.append(fileName) 
-                    # Increment file that need to be deleted counter
-                    fileToDeleteCnt = fileToDeleteCnt + 1
-
-#                    # Copy file detail name to the variable
-#                    fileToDelete = '/var/www/html/recordings/' + fileName
-#
-#                    # Start delete the recording file
-#                    tempArgs = 'rm -r ' + fileToDelete 
-#                    out = subprocess.Popen([tempArgs], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-#                    stdout,stderr = out.communicate()
-#                    # NO error after command execution
-#                    if stderr == None:
-#                        # Write to logger
-#                        if backLogger == True:
-#                            logger.info("DEBUG_AST_REC_DELETE: Delete File: %s SUCCESFULL" % (fileName))
-#                        # Print statement
-#                        else:
-#                            print "DEBUG_AST_REC_DELETE: Delete File: %s SUCCESFULL" % (fileName)
-#
-#                    # Error during command execution        
-#                    else:
-#                        # Write to logger
-#                        if backLogger == True:
-#                            logger.info("DEBUG_AST_REC_DELETE: Delete File: %s FAILED!" % (fileName))
-#                        # Print statement
-#                        else:
-#                            print "DEBUG_AST_REC_DELETE: Delete File: %s FAILED!" % (fileName)
-#
-#                    # Wait before execute another command
-#                    time.sleep(1)
+                if a >= retainRecFile:
+                    # Hand over the audio recording file that need to be deleted to the delete thread
+                    deleteQueue.put(os.path.join(recordDir, fileName))
 
-                # Still within the range 
+                # Still within the range, insert the recording data to the xml file
                 else:
-                    # Copy current recording index no. 
-                    realTotRecFile = a
-                    # Increment by 1 to indicate current total audio recording file 
-                    realTotRecFile = realTotRecFile + 1
-
-                    fileNameCnt = len(fileName)
-                    # Go through each char of file name to retrieved
+                    # Split the file name without audio container name to retrieved
                     # Date, time and extensions involved
-                    for b in range(0, (fileNameCnt + 1)):
-                        oneChar = mid(fileName, b, 1)
-                        # Get recording date and time 
-                        if dataSelect == 0:
-                            # To eliminate 'ogg' audio container name
-                            if oneChar != 'o' and oneChar != 'g':
-                                # Count dash char 
-                                if oneChar == '-':
-                                    dashCnt += 1
-                                    if dashCnt < 4:
-                                        tempDateTimeOfCall += oneChar
-                                # Append the char for date and time data
-                                elif dashCnt < 4:
-                                    tempDateTimeOfCall += oneChar 
-                                # Finish get the full date and time data 
-                                elif dashCnt == 4:
-                                    dateTimeOfCall.append(tempDateTimeOfCall)
-                                    arrayCnt += 1
-
-                                    tempExtInvol += oneChar
-                                    dataSelect = 1
-                                    dashCnt = 0
-
-                        # Get the recording call extensions data
-                        elif dataSelect == 1:
-                            # Append the char for call extensions data
-                            if oneChar != '.':
-                                tempExtInvol += oneChar
-                            # Finish get the full call extensions data
-                            elif oneChar == '.':
-                                extInvol.append(tempExtInvol)
-
-                                # Re initialize necessary variable
-                                dataSelect = 0
-                                tempExtInvol = ''
-                                tempDateTimeOfCall = ''
+                    # Sample: 2021-10-14-0302-6004-6000.ogg -> 2021-10-14-0302, 6004-6000
+                    fileData = os.path.splitext(fileName)[0].rsplit('-', 2)
 
-        # Start construct recording XML files
-        try:
-             # Create intercom extension list xml file structure
-            firstRecordXml = False
-            xmlTree = ''
-
-            xmlRecordRoot = ET.Element('RECORDING')
-            xmlRecordItems = ET.SubElement(xmlRecordRoot, 'INFO')
-
-            # Has recording file
-            #if totRecordFile > 0:
-            if realTotRecFile > 0:
-                # Start insert the recording data to the xml file
-                #for a in range(totRecordFile):
-                for a in range(realTotRecFile):
-                    if firstRecordXml == False:
-                        ET.SubElement(xmlRecordItems, 'DATETIME').text = dateTimeOfCall[a]
-                        ET.SubElement(xmlRecordItems, 'EXTENSIONS').text = extInvol[a]
-                        ET.SubElement(xmlRecordItems, 'FILEPATH').text = recordFile[a]
-
-                        firstRecordXml = True
-
-                    else:
-                        secXmlRecordItems = ET.SubElement(xmlRecordRoot, 'INFO')
-
-                        ET.SubElement(secXmlRecordItems, 'DATETIME').text = dateTimeOfCall[a]
-                        ET.SubElement(secXmlRecordItems, 'EXTENSIONS').text = extInvol[a]
-                        ET.SubElement(secXmlRecordItems, 'FILEPATH').text = recordFile[a]
+                    xmlRecordItems = ET.SubElement(xmlRecordRoot, 'INFO')
+                    ET.SubElement(xmlRecordItems, 'DATETIME').text = fileData[0]
+                    ET.SubElement(xmlRecordItems, 'EXTENSIONS').text = '-'.join(fileData[1:])
+                    ET.SubElement(xmlRecordItems, 'FILEPATH').text = fileName
 
             # NO recording file
-            else:
+            if len(xmlRecordRoot) == 0:
+                xmlRecordItems = ET.SubElement(xmlRecordRoot, 'INFO')
                 ET.SubElement(xmlRecordItems, 'DATETIME').text = 'NA'
                 ET.SubElement(xmlRecordItems, 'EXTENSIONS').text = 'NA'
                 ET.SubElement(xmlRecordItems, 'FILEPATH').text = 'NA'
 
             # Create the xml file
-            # Arrange/prettify the xml structure
-            indent(xmlRecordRoot)
-
-            xmlTree = ET.ElementTree(xmlRecordRoot)
-            # Actual stored folder location
-            if testxml == True:
-                xmlTree.write("/var/www/html/recordinglist.xml")
-            # Test stored folder location
-            else:
-                xmlTree.write("recordinglist.xml")
+            writeXml(xmlRecordRoot, recordListXmlFile)
 
             retResult = True  
-        except:        
-            # Write to logger
-            if backLogger == True:
-                logger.info("DEBUG_AST_REC_LIST: Create xml config file failed!")
-            # Print statement
-            else:
-                print "DEBUG_AST_REC_LIST: Create xml config file failed!"
+        # Error during write process, or invalid XML text data
+        except (OSError, ValueError):
+            logInfo("DEBUG_AST_REC_LIST: Create xml config file failed!")
             return retResult
     
     # Delete audio recording file process BUSY
     else:
-        # Write to logger
-            if backLogger == True:
-                logger.info("DEBUG_AST_REC_LIST: Delete process BUSY!")
-            # Print statement
-            else:
-                print "DEBUG_AST_REC_LIST: Delete process BUSY!"
-            return retResult
+        logInfo("DEBUG_AST_REC_LIST: Delete process BUSY!")
+        return retResult
     
     return retResult            
     
 # Get and process intercom contact list from asterisk extensions.conf
 def getIntercomList(extnNumber, typeUpdt):
     global intercomListData
-    global testxml
+    global intercomListIdx
+    global intercomListMtime
     
     retResult = False
-    firstDatUpdt = False
-    intercomData = '' 
-    intercomExt = ''
+    intercomData = []
     extType = ''
     extNo = ''
     extFullName = ''
     retExtNo = ''
     retFullNme = ''
-    flagCnt = 0
-
-    # Reinitialize back intercom list python dictionary data
-    intercomListData=[
-        {
-            'ext' : '0000',
-            'fullname' : 'NA',
-            'type' : 'NA',
-            'ip' : 'NA'
-        }
-    ]
-		
-    try:
-        usersCnfg = asterisk.config.Config('/etc/asterisk/extensions.conf')
-    except asterisk.config.ParseError as e:
-        # Write to logger
-        if backLogger == True:
-            logger.info("DEBUG_AST_ICOM_CONFIG: Parse Error line: %s: %s" % (e.line, e.strerror))
-        # Print statement
-        else:
-            print "DEBUG_AST_ICOM_CONFIG: Parse Error line: %s: %s" % (e.line, e.strerror)
-        return retResult
-				
-    # Start access asterisk extensions.conf categories
-    for category in usersCnfg.categories:
-        extType = ''
-        extNo = ''
-        extFullName = ''
-        flagCnt = 0
-
-        # Special intercom extensions for category name  
-        #if 'intercomm' in category.name:
-        if 'intercomm' in category.name or 'conferences-' in category.name:
-            # Copy the category name, to get extensions number, type and location 
-            intercomData = category.name
-            datLen = len(intercomData)
-            # Start extract intercom data
-            # Sample data format: intercom-1010-Bilik_SENJATA
-            for a in range(0, (datLen + 1)):
-                oneChar = mid(intercomData, a, 1)
-                # Get extension type
-                if flagCnt == 0:
-                    if oneChar != '-':
-                        extType += oneChar
-                    elif oneChar == '-':
-                        flagCnt = 1
-                # Get intercom extension no.
-                elif flagCnt == 1:
-                    if oneChar != '-':
-                        extNo += oneChar
-                    elif oneChar == '-':
-                        flagCnt = 2
-                # Get intercome full name or location
-                elif flagCnt == 2:
-                    extFullName += oneChar
-                                
-            # Start updating process for python data dictionary
-            try:
-                # Update first data from existing dummy python data dictionary 
-                if firstDatUpdt == False:
-                    extDB = [ extDBB for extDBB in intercomListData ]
-                    extDB[0]['ext'] = extNo
 
-                    # Look location/full name info for this extension no.
-                    if extnNumber == extNo:
-                        # Only take changes
-                        if extDB[0]['fullname'] != extFullName:
-                            # Return value
-                            retExtNo = extNo
-                            retFullNme = extFullName
-                                                    
-                    extDB[0]['fullname'] = extFullName
-                    extDB[0]['type'] = extType
+    # Get asterisk extensions.conf modification time
+    cnfgMtime = getCnfgMtime('/etc/asterisk/extensions.conf')
+
+    # Only parse asterisk extensions.conf when its changed since the last parsed
+    if cnfgMtime is None or cnfgMtime != intercomListMtime:
+        # Reinitialize back intercom list python dictionary data
+        intercomListData=[]
+        intercomListIdx={}
+
+        try:
+            usersCnfg = loadAstConfig('/etc/asterisk/extensions.conf')
+        except asterisk.config.ParseError as e:
+            logInfo("DEBUG_AST_ICOM_CONFIG: Parse Error line: %s: %s", e.line, e.strerror)
+            return retResult
+
+        # Start access asterisk extensions.conf categories
+        for category in usersCnfg.categories:
+            extType = ''
+            extNo = ''
+            extFullName = ''
+
+            # Special intercom extensions for category name  
+            #if 'intercomm' in category.name:
+            if 'intercomm' in category.name or 'conferences-' in category.name:
+                # Split the category name, to get extensions type, number and location
+                # Sample data format: intercom-1010-Bilik_SENJATA
+                intercomData = category.name.split('-', 2)
+                extType = intercomData[0]
+                if len(intercomData) > 1:
+                    extNo = intercomData[1]
+                if len(intercomData) > 2:
+                    extFullName = intercomData[2]
+
+                # Start updating process for python data dictionary
+                # Check the extensions whether its already exist or not
+                extDB = intercomListIdx.get(extNo)
+
+                # NEW intercom list
+                if extDB is None:
+                    # Construct the new data
+                    newData = {
+                                'ext':extNo,
+                                'fullname':extFullName,
+                                'type':extType,
+                                'ip':'NA'
+                                }
+
+                    # Append a NEW intercom extension to the existing record
+                    intercomListData.append(newData)
+                    intercomListIdx[extNo] = newData
 
-                    firstDatUpdt = True
+                # Update the existing data
                 else:
-                    # Check the extensions whether its already exist or not
-                    extDB = [ extDBB for extDBB in intercomListData if (extDBB['ext'] == extNo) ]
-                    # Update the existing data, throw error if record is not exist, consider its a new data
                     # Look location/full name info for this extension no.
                     if extnNumber == extNo:
                         # Only take changes
-                        if extDB[0]['fullname'] != extFullName:
+                        if extDB['fullname'] != extFullName:
                             # Return value
                             retExtNo = extNo
                             retFullNme = extFullName
-                                                    
-                    extDB[0]['fullname'] = extFullName
-                    extDB[0]['type'] = extType
-												
-            # NEW intercom list
-            except:
-                # Construct the new data
-                newData = {
-                            'ext':extNo,
-                            'fullname':extFullName,
-                            'type':extType,
-                            'ip':'NA'
-                            }
-                
-                # Append a NEW intercom extension to the existing record
-                intercomListData.append(newData)
+
+                    extDB['fullname'] = extFullName
+                    extDB['type'] = extType
+
+        # Keep the modification time for the current intercom list
+        intercomListMtime = cnfgMtime
 		
     try:
         # Create intercom extension list xml file structure
-        firstContactXml = False
-        xmlTree = ''
-				
         xmlContactRoot = ET.Element('CONTACT')
-        xmlContactItems = ET.SubElement(xmlContactRoot, 'INFO')
 
         # Start insert the python data dictionary to the xml file
-        for extData in intercomListData:
-            if firstContactXml == False:
-                # Only update IP address to a new value, if previously the setting already take place
-                if extData['ip'] != 'NA':
-                    ET.SubElement(xmlContactItems, 'IPADDR').text = extData['ip']
-                else:
-                    ET.SubElement(xmlContactItems, 'IPADDR').text = 'NA'
-                                
-                ET.SubElement(xmlContactItems, 'LOCATION').text = extData['fullname']
-                ET.SubElement(xmlContactItems, 'CALLID').text = extData['ext']
-                ET.SubElement(xmlContactItems, 'SERVERID').text = 'NA'
-                ET.SubElement(xmlContactItems, 'TYPE').text = extData['type']
-                
-                firstContactXml = True
-            else:
-                secXmlContactItems = ET.SubElement(xmlContactRoot, 'INFO')
+        insertXmlList(xmlContactRoot, 'INFO', contactXmlFields, intercomListData)
 
-                # Only update IP address to a new value, if previously the setting already take place
-                if extData['ip'] != 'NA':
-                    ET.SubElement(secXmlContactItems, 'IPADDR').text = extData['ip']
-                else:
-                    ET.SubElement(secXmlContactItems, 'IPADDR').text = 'NA'
-                                
-                ET.SubElement(secXmlContactItems, 'LOCATION').text = extData['fullname']
-                ET.SubElement(secXmlContactItems, 'CALLID').text = extData['ext']
-                ET.SubElement(secXmlContactItems, 'SERVERID').text = 'NA'
-                ET.SubElement(secXmlContactItems, 'TYPE').text = extData['type']
-								
         # Create the xml file
-        # Arrange/prettify the xml structure
-        indent(xmlContactRoot)
-                                        
-        xmlTree = ET.ElementTree(xmlContactRoot)
-        # Actual stored folder location
-        if testxml == True:
-            xmlTree.write("/var/www/html/intercomlist.xml")
-        # Test stored folder location
-        else:
-            xmlTree.write("intercomlist.xml")
+        writeXml(xmlContactRoot, intercomListXmlFile)
 
         retResult = True
-    except:
-        # Write to logger
-        if backLogger == True:
-            logger.info("DEBUG_AST_ICOM_CONFIG: Create xml config file failed!")
-        # Print statement
-        else:
-            print "DEBUG_AST_ICOM_CONFIG: Create xml config file failed!"
+    # Error during write process, or invalid XML text data
+    except (OSError, ValueError):
+        logInfo("DEBUG_AST_ICOM_CONFIG: Create xml config file failed!")
         return retResult
 				
     return retResult, retExtNo, retFullNme
 
-def getContactListFromSip(typeUpdt,frstNormTypData):
-    global contactListData
-    
+def getContactListFromSip(typeUpdt):
     extName = ''
     extNumber = ''
     
     # load and parse the config file
     try:
-        sipCnfg = asterisk.config.Config('/etc/asterisk/sip.conf')
-    except asterisk.config.ParseError as e:
-        print ("Parse Error line: %s: %s") % (e.line, e.strerror)
-        sys.exit(1)
+        sipCnfg = loadIniConfig('/etc/asterisk/sip.conf')
+    # Return failed to the caller, daemon MUST keep running during REST API request
+    except configparser.Error as e:
+        logInfo("DEBUG_AST_SIP_CONFIG: Parse Error: %s", e)
+        return False
     except IOError as e:
-        print ("Error opening file: %s") % e.strerror
-        sys.exit(1)
+        logInfo("DEBUG_AST_SIP_CONFIG: Error opening file: %s", e.strerror)
+        return False
         
-    for category in sipCnfg.categories:    
-        if category.name != 'general' and category.name != 'tgprovider':
+    for category in sipCnfg.sections():
+        if category != 'general' and category != 'tgprovider':
             extType = ''
-            extNumber = category.name
+            extName = ''
+            extNumber = category
             
-            for item in category.items:
-                if item.name == 'callerid':
-                    #Since sip.conf does not have fullname, we use the item callerid to get its extension type and extension name
-                    #However, because of its format, there will be '<extNumber>' at the end, so we will filter that out from the string
-                    extName = item.value.replace("<"+extNumber+">",'')
-                    extName = extName.replace('"','')
-                    extNLen = extName.find(':') #this function returns the length until it meets ':'
-                    # Get the extension type from the extension full name
-                    for a in range(extNLen):
-                        extType += extName[a]
-                    break # since callerid is in the middle row, and other items on row below is not used, then we break here
+            #Since sip.conf does not have fullname, we use the item callerid to get its extension type and extension name
+            callerId = sipCnfg.get(category, 'callerid', fallback=None)
+            if callerId is not None:
+                #However, because of its format, there will be '<extNumber>' at the end, so we will filter that out from the string
+                extName = callerId.replace("<"+extNumber+">",'')
+                extName = extName.replace('"','')
+                extNLen = extName.find(':') #this function returns the length until it meets ':'
+                # Get the extension type from the extension full name
+                if extNLen > 0:
+                    extType = extName[:extNLen]
                     
             # Normal extension       
             if extType != 'FXO' and typeUpdt == 'Normal':
-                try:
-                    if not frstNormTypData:
-                        contactListData[0]['ext'] = extNumber
-                        contactListData[0]['fullname'] = extName
-                        contactListData[0]['type'] = extType
-                        frstNormTypData = True
-                    else:
-                    # Construct the new data
-                        newData = {
-                                    'ext':extNumber,
-                                    'fullname':extName,
-                                    'type':extType,
-                                    'ip':'NA'
-                                    }
-                        # Append a NEW extension to the existing record
-                        contactListData.append(newData)       
-                except Exception as e :
-                    exc_type, exc_obj, exc_tb = sys.exc_info()
-                    fname = os.path.split(exc_tb.tb_frame.f_code.co_filename)[1]
-                    print(exc_type, fname, exc_tb.tb_lineno)
-    print contactListData
+                # Construct the new data
+                newData = {
+                            'ext':extNumber,
+                            'fullname':extName,
+                            'type':extType,
+                            'ip':'NA'
+                            }
+                # Append a NEW extension to the existing record
+                contactListData.append(newData)       
+    logInfo("DEBUG_AST_SIP_CONFIG: Contact List: %s", contactListData)
+
+    return True
 
 # Get and process contact list from asterisk users.conf
 def getContactList(extnNumber, typeUpdt):
-    global testxml
-    global backLogger
-    global webRtcContListData
     global contactListData
+    global contactListIdx
+    global contactListMtime
+    global contactListXml
+    global contactListXmlIdx
+    global webRtcContListMtime
+    global webRtcContListXml
+    global webRtcContListXmlIdx
             
     retResult = False
-    frstNormTypData = False
-    frstWRtcTypData = False
-    extTypeStrt = False
     extNumber = ''
     extName = ''
     extType = ''    
     extSecret = ''
     retExtNo = ''
     retFullNme = ''
-    
-    extNLen = 0
 
-    # Reinitialize back extensions list python dictionary data
+    # Get asterisk users.conf and sip.conf (normal extensions only) modification time
     if typeUpdt == 'Normal':
-        contactListData=[
-            {
-                'ext' : '0000',
-                'fullname' : 'NA',
-                'type' : 'NA',
-                'ip' : 'NA'
-            }
-        ]
-    # Reinitialize back SIP WebRTC list python dictionary data
+        cnfgMtime = getCnfgMtime('/etc/asterisk/users.conf', '/etc/asterisk/sip.conf')
+        lastMtime = contactListMtime
+    else:
+        cnfgMtime = getCnfgMtime('/etc/asterisk/users.conf')
+        lastMtime = webRtcContListMtime
+
+    # Only parse asterisk config file when its changed since the last parsed
+    if cnfgMtime is None or cnfgMtime != lastMtime:
+        # Reinitialize back extensions list python dictionary data
+        if typeUpdt == 'Normal':
+            contactListData=[]
+            contactListIdx={}
+        # Reinitialize back SIP WebRTC list python dictionary data
 #    else:
 #        webRtcContListData=[
 #            {
@@ -900,84 +882,21 @@ def getContactList(extnNumber, typeUpdt):
 #            }
 #        ]
     
-    try:
-        usersCnfg = asterisk.config.Config('/etc/asterisk/users.conf')
-    except asterisk.config.ParseError as e:
-        # Write to logger
-        if backLogger == True:
-            logger.info("DEBUG_AST_CONFIG: Parse Error line: %s: %s" % (e.line, e.strerror))
-        # Print statement
-        else:
-            print "DEBUG_AST_CONFIG: Parse Error line: %s: %s" % (e.line, e.strerror)
-        return retResult
+        try:
+            usersData = loadUsersConfig('/etc/asterisk/users.conf')
+        except configparser.Error as e:
+            logInfo("DEBUG_AST_CONFIG: Parse Error: %s", e)
+            return retResult, retExtNo, retFullNme
 
-    # Start access asterisk users.conf categories
-    for category in usersCnfg.categories:
-        if category.name != 'general':
-            extType = ''
-            extTypeStrt = False
-            
-            # Get the extension number
-            extNumber = category.name
-            # Start access asterisk users.conf item
-            for item in category.items:
-                # Get the extension full name
-                if item.name == 'fullname':
-                    extName = item.value
-                    extNLen = len(extName)
-                    # Get the extension type from the extension full name
-                    for a in range(0, extNLen + 1):
-                        oneChar = mid(extName, a, 1)
-                        if oneChar == ' ' and extTypeStrt == False:
-                            extTypeStrt = True
-                        elif oneChar != ':' and extTypeStrt == True:
-                            extType += oneChar
-                        elif oneChar == ':' and extTypeStrt == True:
-                            break
-                # Exit loop, other than sip webrtc, no need to check others items
-                elif extType != 'SIP WEBRTC':
-                    break
-                # Get extension secret or sip password                    
-                elif item.name == 'secret':
-                    extSecret = item.value
-                    break
+        # Start access asterisk users.conf extensions data
+        for extNumber, extName, extType, extSecret in usersData:
             # SIP WEBRTC extension 
             if extType == 'SIP WEBRTC' and typeUpdt == 'Webrtc':
-                try:
-                    # Update first data from existing python dictionary dummy data
-                    if frstWRtcTypData == False:
-                        extDB = [ extDBB for extDBB in webRtcContListData ]
-                        extDB[0]['ext'] = extNumber
-
-                        # Look location/full name info for this extension no.
-                        if extnNumber == extNumber:
-                            # Only take changes
-                            if extDB[0]['fullname'] != extName:
-                                # Return value
-                                retExtNo = extNumber
-                                retFullNme = extName
-                        
-                        extDB[0]['fullname'] = extName
-                        extDB[0]['pswd'] = extSecret
-                        
-                        frstWRtcTypData = True
-                    else:
-                        # Check the extensions whether its already exist or not
-                        extDB = [ extDBB for extDBB in webRtcContListData if (extDBB['ext'] == extNumber) ]
-                        # Update the existing data, throw error if record is not exist, consider its a new data
-                        # Look location/full name info for this extension no.
-                        if extnNumber == extNumber:
-                            # Only take changes
-                            if extDB[0]['fullname'] != extName:
-                                # Return value
-                                retExtNo = extNumber
-                                retFullNme = extName
-                            
-                        extDB[0]['fullname'] = extName
-                        extDB[0]['pswd'] = extSecret
-                                      
+                # Check the extensions whether its already exist or not
+                extDB = webRtcContListIdx.get(extNumber)
+
                 # NEW contact list
-                except:
+                if extDB is None:
                     # Construct the new data
                     newData = {
                                 'ext':extNumber,
@@ -990,44 +909,28 @@ def getContactList(extnNumber, typeUpdt):
                                           
                     # Append a NEW extension to the existing record
                     webRtcContListData.append(newData)    
+                    webRtcContListIdx[extNumber] = newData
+
+                # Update the existing data
+                else:
+                    # Look location/full name info for this extension no.
+                    if extnNumber == extNumber:
+                        # Only take changes
+                        if extDB['fullname'] != extName:
+                            # Return value
+                            retExtNo = extNumber
+                            retFullNme = extName
+                        
+                    extDB['fullname'] = extName
+                    extDB['pswd'] = extSecret
+                                  
             # Normal extension
             elif extType != 'FXO' and typeUpdt == 'Normal':
-                # Update python contact list data
-                try:
-                    # Update first data from existing python dictionary dummy data
-                    if frstNormTypData == False:
-                        extDB = [ extDBB for extDBB in contactListData ]
-                        extDB[0]['ext'] = extNumber
-
-                        # Look location/full name info for this extension no.
-                        if extnNumber == extNumber:
-                            # Only take changes
-                            if extDB[0]['fullname'] != extName:
-                                # Return value
-                                retExtNo = extNumber
-                                retFullNme = extName
-                                
-                        extDB[0]['fullname'] = extName
-                        extDB[0]['type'] = extType
-
-                        frstNormTypData = True
-                    else:
-                        # Check the extensions whether its already exist or not
-                        extDB = [ extDBB for extDBB in contactListData if (extDBB['ext'] == extNumber) ]
-                        # Update the existing data, throw error if record is not exist, consider its a new data
-                        # Look location/full name info for this extension no.
-                        if extnNumber == extNumber:
-                            # Only take changes
-                            if extDB[0]['fullname'] != extName:
-                                # Return value
-                                retExtNo = extNumber
-                                retFullNme = extName
-                                
-                        extDB[0]['fullname'] = extName
-                        extDB[0]['type'] = extType
-                
+                # Check the extensions whether its already exist or not
+                extDB = contactListIdx.get(extNumber)
+
                 # NEW contact list
-                except:
+                if extDB is None:
                     # Construct the new data
                     newData = {
                                 'ext':extNumber,
@@ -1038,149 +941,81 @@ def getContactList(extnNumber, typeUpdt):
                     
                     # Append a NEW extension to the existing record
                     contactListData.append(newData)
-    getContactListFromSip(typeUpdt,frstNormTypData)
-    try:
-        # Create extension list xml file structure
-        firstContactXml = False
-        xmlTree = ''
+                    contactListIdx[extNumber] = newData
 
-        # Update XML file for normal extensions list
-        if typeUpdt == 'Normal':
-            xmlContactRoot = ET.Element('CONTACT')
-            xmlContactItems = ET.SubElement(xmlContactRoot, 'INFO')
-
-            # Start insert the python dictionary data to the xml file
-            for extData in contactListData:
-                if firstContactXml == False:
-                    # Only update IP address to a new value, if previously the setting already take place
-                    if extData['ip'] != 'NA':
-                        ET.SubElement(xmlContactItems, 'IPADDR').text = extData['ip']
-                    else:
-                        ET.SubElement(xmlContactItems, 'IPADDR').text = 'NA'
-                        
-                    ET.SubElement(xmlContactItems, 'LOCATION').text = extData['fullname']
-                    ET.SubElement(xmlContactItems, 'CALLID').text = extData['ext']
-                    ET.SubElement(xmlContactItems, 'SERVERID').text = 'NA'
-                    ET.SubElement(xmlContactItems, 'TYPE').text = extData['type']
-                    
-                    firstContactXml = True
+                # Update python contact list data
                 else:
-                    secXmlContactItems = ET.SubElement(xmlContactRoot, 'INFO')
+                    # Look location/full name info for this extension no.
+                    if extnNumber == extNumber:
+                        # Only take changes
+                        if extDB['fullname'] != extName:
+                            # Return value
+                            retExtNo = extNumber
+                            retFullNme = extName
+                            
+                    extDB['fullname'] = extName
+                    extDB['type'] = extType
+        # Error during sip.conf read process, parse again during next get contact list
+        if getContactListFromSip(typeUpdt) == False:
+            return retResult, retExtNo, retFullNme
 
-                    # Only update IP address to a new value, if previously the setting already take place
-                    if extData['ip'] != 'NA':
-                        ET.SubElement(secXmlContactItems, 'IPADDR').text = extData['ip']
-                    else:
-                        ET.SubElement(secXmlContactItems, 'IPADDR').text = 'NA'
-                        
-                    ET.SubElement(secXmlContactItems, 'LOCATION').text = extData['fullname']
-                    ET.SubElement(secXmlContactItems, 'CALLID').text = extData['ext']
-                    ET.SubElement(secXmlContactItems, 'SERVERID').text = 'NA'
-                    ET.SubElement(secXmlContactItems, 'TYPE').text = extData['type']
-                    
-            # Create the xml file
-            # Arrange/prettify the xml structure
-            indent(xmlContactRoot)
-                    
-            xmlTree = ET.ElementTree(xmlContactRoot)
-            # Actual stored folder location
-            if testxml == True:
-                xmlTree.write("/var/www/html/listContact.xml")
-            # Test stored folder location
-            else:
-                xmlTree.write("listContact.xml")
+        # Rebuild extensions/contact list lookup index, include extensions from sip.conf
+        if typeUpdt == 'Normal':
+            contactListIdx = indexList(contactListData)
 
-            retResult = True
-        
-        # Update XML file for SIP WebRTC extensions list
+        # Keep the modification time for the current contact list
+        if typeUpdt == 'Normal':
+            contactListMtime = cnfgMtime
         else:
-            xmlContactRoot = ET.Element('REGISTRAR')
-            xmlContactItems = ET.SubElement(xmlContactRoot, 'SERVER')
-            
-            # Start insert the python dictionary data to the xml file
-            for extData in webRtcContListData:
-                if firstContactXml == False:
-                    # Only update IP address to a new value, if previously the setting already take place
-                    if extData['ip'] != 'NA':
-                        ET.SubElement(xmlContactItems, 'IPADDR').text = extData['ip']
-                    else:
-                        ET.SubElement(xmlContactItems, 'IPADDR').text = 'NA'
-                        
-                    ET.SubElement(xmlContactItems, 'LOCATION').text = extData['fullname']
-
-                    # Only update SIP WebRTC availability list to a new value, if previously the setting already take place
-                    if extData['avail'] != 'NA':
-                        ET.SubElement(xmlContactItems, 'AVAIL').text = extData['avail']
-                    else:
-                        ET.SubElement(xmlContactItems, 'AVAIL').text = 'NA'
-                        
-                    ET.SubElement(xmlContactItems, 'USERNAME').text = extData['ext']
-
-                    # Only update SIP address to a new value, if previously the setting already take place
-                    if extData['sip'] != 'NA':
-                        ET.SubElement(xmlContactItems, 'SIPADDR').text = extData['sip']
-                    else:
-                        ET.SubElement(xmlContactItems, 'SIPADDR').text = 'NA'
+            webRtcContListMtime = cnfgMtime
 
-                    ET.SubElement(xmlContactItems, 'PSWD').text = extData['pswd']
-                    
-                    firstContactXml = True
-                else:
-                    secXmlContactItems = ET.SubElement(xmlContactRoot, 'SERVER')
+    try:
+        # Create extension list xml file structure
+        # Build, keep and write the xml file structure while holding xmlLock, REST API PUT request and XML file
+        # write thread only see a complete xml file structure, and the XML file are written in order
+        with xmlLock:
+            # Update XML file for normal extensions list
+            if typeUpdt == 'Normal':
+                contactListXml = ET.Element('CONTACT')
 
-                    # Only update IP address to a new value, if previously the setting already take place
-                    if extData['ip'] != 'NA':
-                        ET.SubElement(secXmlContactItems, 'IPADDR').text = extData['ip']
-                    else:
-                        ET.SubElement(secXmlContactItems, 'IPADDR').text = 'NA'
-                        
-                    ET.SubElement(secXmlContactItems, 'LOCATION').text = extData['fullname']
+                # Start insert the python dictionary data to the xml file
+                # Keep the xml file structure for the next extensions IP address update
+                contactListXmlIdx = insertXmlList(contactListXml, 'INFO', contactXmlFields, contactListData)
 
-                    # Only update SIP WebRTC availability list to a new value, if previously the setting already take place
-                    if extData['avail'] != 'NA':
-                        ET.SubElement(secXmlContactItems, 'AVAIL').text = extData['avail']
-                    else:
-                        ET.SubElement(secXmlContactItems, 'AVAIL').text = 'NA'
-                    
-                    ET.SubElement(secXmlContactItems, 'USERNAME').text = extData['ext']
+                # Create the xml file
+                writeXml(contactListXml, contactListXmlFile)
 
-                    # Only update SIP address to a new value, if previously the setting already take place
-                    if extData['sip'] != 'NA':
-                        ET.SubElement(secXmlContactItems, 'SIPADDR').text = extData['sip']
-                    else:
-                        ET.SubElement(secXmlContactItems, 'SIPADDR').text = 'NA'
-                        
-                    ET.SubElement(secXmlContactItems, 'PSWD').text = extData['pswd']
-                    
-            # Create the xml file
-            # Arrange/prettify the xml structure
-            indent(xmlContactRoot)
+                retResult = True
             
-            xmlTree = ET.ElementTree(xmlContactRoot)
-            # Actual stored folder location
-            if testxml == True:
-                xmlTree.write("/var/www/html/registrarlist.xml")
-            # Test stored folder location
+            # Update XML file for SIP WebRTC extensions list
             else:
-                xmlTree.write("registrarlist.xml")
-            retResult = True
-    except:
-        # Write to logger
-        if backLogger == True:
-            logger.info("DEBUG_AST_CONFIG: Create xml config file failed!")
-        # Print statement
-        else:
-            print "DEBUG_AST_CONFIG: Create xml config file failed!"
-        return retResult
+                webRtcContListXml = ET.Element('REGISTRAR')
+                
+                # Start insert the python dictionary data to the xml file
+                # Keep the xml file structure for the next SIP WebRTC IP address and availability update
+                webRtcContListXmlIdx = insertXmlList(webRtcContListXml, 'SERVER', webRtcXmlFields, webRtcContListData)
+
+                # Create the xml file
+                writeXml(webRtcContListXml, webRtcContListXmlFile)
+                retResult = True
+    # Error during write process, or invalid XML text data
+    except (OSError, ValueError):
+        logInfo("DEBUG_AST_CONFIG: Create xml config file failed!")
+        return retResult, retExtNo, retFullNme
 
     return retResult, retExtNo, retFullNme
     
+# Cross-Origin (CORS) response headers
+corsHeaders = {
+    'Access-Control-Allow-Origin' : '*',
+    'Access-Control-Allow-Headers' : 'Content-Type,Authorization',
+    'Access-Control-Allow-Methods' : 'GET,PUT,POST,DELETE'
+}
+
 # Handle Cross-Origin (CORS) problem upon client request
 @app.after_request
 def add_headers(response):
-    response.headers.add('Access-Control-Allow-Origin', '*')
-    response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
-    response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE')
+    response.headers.extend(corsHeaders)
 
     return response
 
@@ -1191,44 +1026,37 @@ def add_headers(response):
 def deleteRecData(statustype, filedetail):
     retResult = False
     fileToDelete = ''
-    tempArgs = ''
     updtType = ''
     
     try:
-        updtLst = [ updtLstT for updtLstT in listUpdtData if (updtLstT['type'] == statustype) ]
+        updtLst = [ listUpdtIdx[statustype] ]
         updtType = updtLst[0]['type']
         if updtType == 'Recording':
             # Copy file detail name to the variable
-            fileToDelete = '/var/www/html/recordings/' + filedetail
+            # Only the file name are used, file can only be deleted inside the recordings folder
+            fileToDelete = os.path.join(recordDir, os.path.basename(filedetail))
 
             # Start delete the recording file
-            tempArgs = 'rm -r ' + fileToDelete 
-            out = subprocess.Popen([tempArgs], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-            stdout,stderr = out.communicate()
-            # NO error after command execution
-            if stderr == None:
-                # Write to logger
-                if backLogger == True:
-                    logger.info("DEBUG_DELETE_RECORD: Delete File: %s SUCCESFULL" % (filedetail))
-                # Print statement
-                else:
-                    print "DEBUG_DELETE_RECORD: Delete File: %s SUCCESFULL" % (filedetail)
+            try:
+                os.unlink(fileToDelete)
+
+            # Error during delete process
+            except OSError:
+                logInfo("DEBUG_DELETE_RECORD: Delete File: %s FAILED!", filedetail)
+
+                # Update return status failed!
+                updtLst[0]['status'] = 'FAILED'
+
+            # NO error during delete process
+            else:
+                logInfo("DEBUG_DELETE_RECORD: Delete File: %s SUCCESFULL", filedetail)
 
                 # Update back XML file with the new recording file contents
                 getRecordFile()
                 # Update return status sucessfull
                 updtLst[0]['status'] = 'SUCCESFULL'
-            else: 
-                # Write to logger
-                if backLogger == True:
-                    logger.info("DEBUG_DELETE_RECORD: Delete File: %s FAILED!" % (filedetail))
-                # Print statement
-                else:
-                    print "DEBUG_DELETE_RECORD: Delete File: %s FAILED!" % (filedetail)
-                    
-                # Update return status failed!
-                updtLst[0]['status'] = 'FAILED'
-    except:
+    except Exception as err:
+        logInfo("DEBUG_REST_API: %s request failed! %s", request.path, repr(err))
         return jsonify({'UpdatedStatusInfo' : updateFailed})
     return jsonify({'UpdatedStatusInfo' : updtLst})
     
@@ -1243,7 +1071,7 @@ def updatedRecList(statustype):
     updtType = ''
     
     try:
-        updtLst = [ updtLstT for updtLstT in listUpdtData if (updtLstT['type'] == statustype) ]
+        updtLst = [ listUpdtIdx[statustype] ]
         updtType = updtLst[0]['type']
         if updtType == 'Recording':
             # Get current list of the call audio file 
@@ -1254,7 +1082,8 @@ def updatedRecList(statustype):
             else:
                 # Update return status failed!
                 updtLst[0]['status'] = 'FAILED'
-    except:
+    except Exception as err:
+        logInfo("DEBUG_REST_API: %s request failed! %s", request.path, repr(err))
         return jsonify({'UpdatedStatusInfo' : updateFailed})
     return jsonify({'UpdatedStatusInfo' : updtLst})
     
@@ -1271,7 +1100,7 @@ def updatedIComList(statustype, extNo):
     retFullNme = ''
 		
     try:
-        updtLst = [ updtLstT for updtLstT in listUpdtData if (updtLstT['type'] == statustype) ]
+        updtLst = [ listUpdtIdx[statustype] ]
         updtType = updtLst[0]['type']
         if updtType == 'Intercomm':
             # Get updated intercomm list
@@ -1294,7 +1123,8 @@ def updatedIComList(statustype, extNo):
             else:
                 # Update return status failed!
                 updtLst[0]['status'] = 'FAILED'
-    except:
+    except Exception as err:
+        logInfo("DEBUG_REST_API: %s request failed! %s", request.path, repr(err))
         return jsonify({'UpdatedStatusInfo' : updateFailed})
     return jsonify({'UpdatedStatusInfo' : updtLst})
 		
@@ -1311,7 +1141,7 @@ def updatedList(statustype, extNo):
     retFullNme = ''
     
     try:
-        updtLst = [ updtLstT for updtLstT in listUpdtData if (updtLstT['type'] == statustype) ]
+        updtLst = [ listUpdtIdx[statustype] ]
         updtType = updtLst[0]['type']
         if updtType == 'Normal' or updtType == 'Webrtc': 
             # Update contacts/extensions list
@@ -1333,7 +1163,8 @@ def updatedList(statustype, extNo):
             else:
                 # Update return status succesfull
                 updtLst[0]['status'] = 'FAILED'
-    except:
+    except Exception as err:
+        logInfo("DEBUG_REST_API: %s request failed! %s", request.path, repr(err))
         return jsonify({'UpdatedStatusInfo' : updateFailed})
     return jsonify({'UpdatedStatusInfo' : updtLst})
 
@@ -1342,63 +1173,39 @@ def updatedList(statustype, extNo):
 # curl -i -H "Content-type: application/json" -X PUT -d "{\"ip\":\"192.168.1.1\"}" http://192.168.1.1:8000/ext/6004
 @app.route('/ext/<extNo>', methods=['PUT'])
 def updateExtData(extNo):
+    global contactListMtime
+    global contactListXml
+    global contactListXmlIdx
+
     try:
         # Initialize data dictionary
-        extNum = [ extNumM for extNumM in contactListData if (extNumM['ext'] == extNo) ]
+        extNum = []
+        if extNo in contactListIdx:
+            extNum.append(contactListIdx[extNo])
         # Update extensons IP address
         if 'ip' in request.json:
+            # Only accept text data, other data can't be written to the XML file
+            if not isinstance(request.json['ip'], str):
+                raise ValueError("Invalid ip: %r" % request.json['ip'])
             extNum[0]['ip'] = request.json['ip']
+            # Normal contact list data changed, rebuild from asterisk config file during next get contact list
+            contactListMtime = None
 
-            # Create normal extension list xml file structure - listContact.xml
-            firstContactXml = False
-            xmlTree = ''
-            
-            xmlContactRoot = ET.Element('CONTACT')
-            xmlContactItems = ET.SubElement(xmlContactRoot, 'INFO')
-
-            # Start insert the python dictionary data to the xml file
-            for extData in contactListData:
-                if firstContactXml == False:
-                    # Only update IP address to a new value, if previously the setting already take place
-                    if extData['ip'] != 'NA':
-                        ET.SubElement(xmlContactItems, 'IPADDR').text = extData['ip']
-                    else:
-                        ET.SubElement(xmlContactItems, 'IPADDR').text = 'NA'
+            with xmlLock:
+                # Create normal extension list xml file structure once - listContact.xml
+                if contactListXml is None:
+                    contactListXml = ET.Element('CONTACT')
+                    contactListXmlIdx = insertXmlList(contactListXml, 'INFO', contactXmlFields, contactListData)
 
-                    ET.SubElement(xmlContactItems, 'LOCATION').text = extData['fullname']
-                    ET.SubElement(xmlContactItems, 'CALLID').text = extData['ext']
-                    ET.SubElement(xmlContactItems, 'SERVERID').text = 'NA'
-                    ET.SubElement(xmlContactItems, 'TYPE').text = extData['type']
-                    
-                    firstContactXml = True
-                else:
-                    secXmlContactItems = ET.SubElement(xmlContactRoot, 'INFO')
+                # Only update IP address for this extension record
+                contactListXmlIdx[extNo].find('IPADDR').text = extNum[0]['ip']
 
-                    # Only update IP address to a new value, if previously the setting already take place
-                    if extData['ip'] != 'NA':
-                        ET.SubElement(secXmlContactItems, 'IPADDR').text = extData['ip']
-                    else:
-                        ET.SubElement(secXmlContactItems, 'IPADDR').text = 'NA'
-                        
-                    ET.SubElement(secXmlContactItems, 'LOCATION').text = extData['fullname']
-                    ET.SubElement(secXmlContactItems, 'CALLID').text = extData['ext']
-                    ET.SubElement(secXmlContactItems, 'SERVERID').text = 'NA'
-                    ET.SubElement(secXmlContactItems, 'TYPE').text = extData['type']    
-
-                # Create the xml file
-                # Arrange/prettify the xml structure
-                indent(xmlContactRoot)
-                
-                xmlTree = ET.ElementTree(xmlContactRoot)
-                # Actual stored folder location
-                if testxml == True:
-                    xmlTree.write("/var/www/html/listContact.xml")
-                # Test stored folder location
-                else:
-                    xmlTree.write("listContact.xml")
+                # Create the xml file via XML file write thread
+                queueXmlWrite(lambda: contactListXml, contactListXmlFile)
                     
         return jsonify({'UpdatedExtInfo' : extNum})        
-    except:
+    except Exception as err:
+        logInfo("DEBUG_REST_API: %s request failed! %s", request.path, repr(err))
         return jsonify({'UpdatedStatusInfo' : updateFailed})
     
 # Update webrtc extensions/contacts list - IP address and SIP WebRTC availability list
@@ -1408,76 +1215,23 @@ def updateExtData(extNo):
 # curl -i -H "Content-type: application/json" -X PUT -d "{\"avail\":\"DUMMY\"}" http://192.168.1.1:8000/webrtc/6004
 @app.route('/webrtc/<extNo>', methods=['PUT'])
 def updateWebRtcData(extNo):
+    global webRtcContListXml
+    global webRtcContListXmlIdx
+
     try:
         # Initialize data dictionary
-        webRtc = [ webRtcC for webRtcC in webRtcContListData if (webRtcC['ext'] == extNo) ]
+        webRtc = []
+        if extNo in webRtcContListIdx:
+            webRtc.append(webRtcContListIdx[extNo])
+        # Only accept text data, other data can't be written to the XML file
+        for key in ('ip', 'avail'):
+            if key in request.json and not isinstance(request.json[key], str):
+                raise ValueError("Invalid %s: %r" % (key, request.json[key]))
         # Update webrtc ip address
         if 'ip' in request.json:
             webRtc[0]['ip'] = request.json['ip']
             webRtc[0]['sip'] = 'sip:' + webRtc[0]['ext'] + '@' + request.json['ip']
 
-            # Create webrtc extension list xml file structure - registrarlist.xml
-            firstContactXml = False
-            xmlTree = ''
-            
-            xmlContactRoot = ET.Element('REGISTRAR')
-            xmlContactItems = ET.SubElement(xmlContactRoot, 'SERVER')
-            
-            # Start insert the python dictionary data to the xml file
-            for extData in webRtcContListData:
-                if firstContactXml == False:
-                    # Only update IP address to a new value, if previously the setting already take place
-                    if extData['ip'] != 'NA':
-                        ET.SubElement(xmlContactItems, 'IPADDR').text = extData['ip']
-                    else:
-                        ET.SubElement(xmlContactItems, 'IPADDR').text = 'NA'
-                        
-                    ET.SubElement(xmlContactItems, 'LOCATION').text = extData['fullname']
-                    ET.SubElement(xmlContactItems, 'AVAIL').text = extData['avail']
-                    ET.SubElement(xmlContactItems, 'USERNAME').text = extData['ext']
-
-                    # Only update SIP address to a new value, if previously the setting already take place
-                    if extData['sip'] != 'NA':
-                        ET.SubElement(xmlContactItems, 'SIPADDR').text = extData['sip']
-                    else:
-                        ET.SubElement(xmlContactItems, 'SIPADDR').text = 'NA'
-                        
-                    ET.SubElement(xmlContactItems, 'PSWD').text = extData['pswd']
-                    
-                    firstContactXml = True
-                else:
-                    secXmlContactItems = ET.SubElement(xmlContactRoot, 'SERVER')
-
-                    # Only update IP address to a new value, if previously the setting already take place
-                    if extData['ip'] != 'NA':
-                        ET.SubElement(secXmlContactItems, 'IPADDR').text = extData['ip']
-                    else:
-                        ET.SubElement(secXmlContactItems, 'IPADDR').text = 'NA'
-                        
-                    ET.SubElement(secXmlContactItems, 'LOCATION').text = extData['fullname']
-                    ET.SubElement(secXmlContactItems, 'AVAIL').text = extData['avail']
-                    ET.SubElement(secXmlContactItems, 'USERNAME').text = extData['ext']
-
-                    # Only update SIP address to a new value, if previously the setting already take place
-                    if extData['sip'] != 'NA':
-                        ET.SubElement(secXmlContactItems, 'SIPADDR').text = extData['sip']
-                    else:
-                        ET.SubElement(secXmlContactItems, 'SIPADDR').text = 'NA'
-                        
-                    ET.SubElement(secXmlContactItems, 'PSWD').text = extData['pswd']
-
-            # Create the xml file
-            # Arrange/prettify the xml structure
-            indent(xmlContactRoot)
-            
-            xmlTree = ET.ElementTree(xmlContactRoot)
-            # Actual stored folder location
-            if testxml == True:
-                xmlTree.write("/var/www/html/registrarlist.xml")
-            # Test stored folder location
-            else:
-                xmlTree.write("registrarlist.xml")
-
         # Update SIP WebRTC availability list
         elif 'avail' in request.json:
             checkTyp = request.json['avail']
@@ -1486,59 +1240,6 @@ def updateWebRtcData(extNo):
             if checkTyp != "DUMMY":
                 # Update for availability: AVAILABLE or OCCUPIED
                 webRtc[0]['avail'] = request.json['avail']
-                
-                # Create webrtc extension list xml file structure - registrarlist.xml
-                firstContactXml = False
-                xmlTree = ''
-                
-                xmlContactRoot = ET.Element('REGISTRAR')
-                xmlContactItems = ET.SubElement(xmlContactRoot, 'SERVER')
-
-                # Start insert the python dictionary data to the xml file
-                for extData in webRtcContListData:
-                    if firstContactXml == False:
-                        ET.SubElement(xmlContactItems, 'IPADDR').text = extData['ip']
-                        ET.SubElement(xmlContactItems, 'LOCATION').text = extData['fullname']
-
-                        # Only update SIP WebRTC list to a new value, if previously the setting already take place
-                        if extData['avail'] != 'NA':
-                            ET.SubElement(xmlContactItems, 'AVAIL').text = extData['avail']
-                        else:
-                            ET.SubElement(xmlContactItems, 'AVAIL').text = 'NA'
-                        
-                        ET.SubElement(xmlContactItems, 'USERNAME').text = extData['ext']
-                        ET.SubElement(xmlContactItems, 'SIPADDR').text = extData['sip']
-                        ET.SubElement(xmlContactItems, 'PSWD').text = extData['pswd']
-                        
-                        firstContactXml = True
-                    else:
-                        secXmlContactItems = ET.SubElement(xmlContactRoot, 'SERVER')
-
-                        ET.SubElement(secXmlContactItems, 'IPADDR').text = extData['ip']
-                        ET.SubElement(secXmlContactItems, 'LOCATION').text = extData['fullname']
-
-                        # Only update SIP WebRTC list to a new value, if previously the setting already take place
-                        if extData['avail'] != 'NA':
-                            ET.SubElement(secXmlContactItems, 'AVAIL').text = extData['avail']
-                        else:
-                            ET.SubElement(secXmlContactItems, 'AVAIL').text = 'NA'
-                        
-                        ET.SubElement(secXmlContactItems, 'USERNAME').text = extData['ext']
-                        ET.SubElement(secXmlContactItems, 'SIPADDR').text = extData['sip']
-                        ET.SubElement(secXmlContactItems, 'PSWD').text = extData['pswd']
-                        
-                # Create the xml file
-                # Arrange/prettify the xml structure
-                indent(xmlContactRoot)
-                
-                xmlTree = ET.ElementTree(xmlContactRoot)
-                
-                # Actual stored folder location
-                if testxml == True:
-                    xmlTree.write("/var/www/html/registrarlist.xml")
-                # Test stored folder location
-                else:
-                    xmlTree.write("registrarlist.xml")
 
             # Reset previous SIP WebRTC account availability 
             else:
@@ -1547,48 +1248,24 @@ def updateWebRtcData(extNo):
                 webRtc[0]['ip'] = 'NA'
                 webRtc[0]['sip'] = 'NA'
 
-                # Create webrtc extension list xml file structure - registrarlist.xml
-                firstContactXml = False
-                xmlTree = ''
-                
-                xmlContactRoot = ET.Element('REGISTRAR')
-                xmlContactItems = ET.SubElement(xmlContactRoot, 'SERVER')
+        # Nothing to update
+        else:
+            return jsonify({'UpdatedWebRtcInfo' : webRtc})
 
-                # Start insert the python dictionary data to the xml file
-                for extData in webRtcContListData:
-                    if firstContactXml == False:
-                        ET.SubElement(xmlContactItems, 'IPADDR').text = extData['ip']
-                        ET.SubElement(xmlContactItems, 'LOCATION').text = extData['fullname']
-                        ET.SubElement(xmlContactItems, 'AVAIL').text = extData['avail']
-                        ET.SubElement(xmlContactItems, 'USERNAME').text = extData['ext']
-                        ET.SubElement(xmlContactItems, 'SIPADDR').text = extData['sip']
-                        ET.SubElement(xmlContactItems, 'PSWD').text = extData['pswd']
-                        
-                        firstContactXml = True
-                    else:
-                        secXmlContactItems = ET.SubElement(xmlContactRoot, 'SERVER')
-
-                        ET.SubElement(secXmlContactItems, 'IPADDR').text = extData['ip']
-                        ET.SubElement(secXmlContactItems, 'LOCATION').text = extData['fullname']
-                        ET.SubElement(secXmlContactItems, 'AVAIL').text = extData['avail']
-                        ET.SubElement(secXmlContactItems, 'USERNAME').text = extData['ext']
-                        ET.SubElement(secXmlContactItems, 'SIPADDR').text = extData['sip']
-                        ET.SubElement(secXmlContactItems, 'PSWD').text = extData['pswd']
-                        
-                # Create the xml file
-                # Arrange/prettify the xml structure
-                indent(xmlContactRoot)
-                
-                xmlTree = ET.ElementTree(xmlContactRoot)
-                
-                # Actual stored folder location
-                if testxml == True:
-                    xmlTree.write("/var/www/html/registrarlist.xml")
-                # Test stored folder location
-                else:
-                    xmlTree.write("registrarlist.xml")
+        with xmlLock:
+            # Create webrtc extension list xml file structure once - registrarlist.xml
+            if webRtcContListXml is None:
+                webRtcContListXml = ET.Element('REGISTRAR')
+                webRtcContListXmlIdx = insertXmlList(webRtcContListXml, 'SERVER', webRtcXmlFields, webRtcContListData)
 
-    except:
+            # Only update this SIP WebRTC extension record
+            updateXmlRecord(webRtcContListXmlIdx[extNo], webRtcXmlFields, webRtc[0])
+
+            # Create the xml file via XML file write thread
+            queueXmlWrite(lambda: webRtcContListXml, webRtcContListXmlFile)
+
+    except Exception as err:
+        logInfo("DEBUG_REST_API: %s request failed! %s", request.path, repr(err))
         return jsonify({'UpdatedStatusInfo' : updateFailed})    
     return jsonify({'UpdatedWebRtcInfo' : webRtc})
 
@@ -1599,13 +1276,104 @@ def updateWebRtcData(extNo):
 def getCallInfoDb():
     return jsonify({'CallStatusInfo' : hangupData})
 
+# Read one asterisk manager interface packet, "Key: Value" lines until an empty line
+def amiReadPacket():
+    amiPacket = {}
+    while True:
+        amiLine = amiFile.readline()
+        # Connection closed by asterisk
+        if not amiLine:
+            raise OSError("AMI connection closed")
+        amiLine = amiLine.decode('utf-8', 'replace').rstrip('\r\n')
+        if amiLine == '':
+            if amiPacket:
+                return amiPacket
+        else:
+            key, sep, value = amiLine.partition(':')
+            amiPacket[key] = value.strip()
+
+# Send one asterisk manager interface action, return its response packet followed by its list event
+# packets until the pass end event
+def amiSendAction(amiAction, endEvent=None):
+    global amiActId
+
+    amiActId += 1
+    actId = str(amiActId)
+    amiMsg = ''.join('%s: %s\r\n' % (key, value) for key, value in amiAction)
+    amiSock.sendall((amiMsg + 'ActionID: ' + actId + '\r\n\r\n').encode('utf-8'))
+
+    amiPackets = []
+    while True:
+        amiPacket = amiReadPacket()
+        # Ignore unrelated event packets
+        if amiPacket.get('ActionID') != actId:
+            continue
+        amiPackets.append(amiPacket)
+        if endEvent is None or amiPacket.get('Event') == endEvent or amiPacket.get('Response') == 'Error':
+            return amiPackets
+
+# Close asterisk manager interface connection
+def amiClose():
+    global amiSock
+    global amiFile
+
+    if amiFile is not None:
+        amiFile.close()
+    if amiSock is not None:
+        amiSock.close()
+    amiSock = None
+    amiFile = None
+
+# Open and login asterisk manager interface connection
+def amiConnect():
+    global amiSock
+    global amiFile
+
+    amiSock = socket.create_connection(amiAddr, timeout=5)
+    amiFile = amiSock.makefile('rb')
+    # Skip asterisk manager interface greeting line
+    amiFile.readline()
+
+    # Login without events, only action response are needed
+    amiResp = amiSendAction([('Action', 'Login'), ('Username', amiuser), ('Secret', amisecret), ('Events', 'off')])
+    if amiResp[0].get('Response') != 'Success':
+        raise OSError("AMI login failed: " + amiResp[0].get('Message', ''))
+
+# Execute asterisk manager interface action through the persistent connection, reconnect once if the
+# connection was lost. Return the action response and list event packets, or None during connection error
+def amiAction(amiAction, endEvent=None):
+    with amiLock:
+        for amiRetry in range(2):
+            try:
+                if amiSock is None:
+                    amiConnect()
+                return amiSendAction(amiAction, endEvent)
+            except OSError as err:
+                logInfo("DEBUG_AMI: Asterisk manager interface error: %s", err)
+                amiClose()
+    return None
+
+# Execute asterisk command via linux terminal, return its output and its error message (None for NO error)
+def runAstCommand(astCmd):
+    try:
+        out = subprocess.run(['asterisk', '-rx', astCmd], capture_output=True, universal_newlines=True)
+    # Asterisk command not exist or cannot be executed
+    except OSError as err:
+        return '', str(err)
+
+    if out.returncode != 0:
+        return out.stdout, out.stderr or out.stdout or ('Exit status %d' % out.returncode)
+    return out.stdout, None
+
 # Terminate a dispatch call based on the given channel
 # Example command to send:
 # curl -i -H "Content-type: application/json" -X PUT -d "{\"callchannel\":\"1001\"}" http://192.168.1.1:8000/terminatecall/000
 @app.route('/terminatecall/<hgUpId>', methods=['PUT'])
 def terminateGivenCall(hgUpId):
     # Initialize data dictionary
-    hgup = [ hgupP for hgupP in hangupData if (hgupP['id'] == hgUpId) ]
+    hgup = []
+    if hgUpId in hangupIdx:
+        hgup.append(hangupIdx[hgUpId])
     
     # Terminate the given call dispatch channel
     if 'callchannel' in request.json:
@@ -1614,126 +1382,87 @@ def terminateGivenCall(hgUpId):
         # Retrieve call channel to terminate
         terminateChan = hgup[0]['callchannel']
 
-        # Write to logger
-        if backLogger == True:
-            logger.info("DEBUG_TERMINATE_STATUS: Request Channel: %s" % (terminateChan))
-        # Print statement
-        else:
-            print "DEBUG_TERMINATE_STATUS: Request Channel: %s" % (terminateChan)
+        logInfo("DEBUG_TERMINATE_STATUS: Request Channel: %s", terminateChan)
         
+        # Retrieve connected channel list via asterisk manager interface
+        if amiuser is not None:
+            amiResp = amiAction([('Action', 'CoreShowChannels')], 'CoreShowChannelsComplete')
+            if amiResp is not None and amiResp[0].get('Response') == 'Success':
+                chanList = [ amiPacket['Channel'] for amiPacket in amiResp if amiPacket.get('Event') == 'CoreShowChannel' ]
+                stderr = None
+            else:
+                chanList = []
+                stderr = "AMI CoreShowChannels action failed"
+
+            logInfo("DEBUG_TERMINATE_STATUS: Connected Channel List: %s", chanList)
+
         # Execute asterisk command via linux terminal
-        # Sample reply:
-        # SIP/1002-0000007b!myphones!!1!Up!AppDial!(Outgoing Line)!1002!!!3!196!0377ef02-fcb0-490a-8231-53ed81fa9d4a!1580297330.202
-        # SIP/1001-0000007a!myphones!1002!1!Up!Dial!SIP/1002!1003!!!3!196!0377ef02-fcb0-490a-8231-53ed81fa9d4a!1580297330.200
-        # Message/ast_msg_queue!mychatmessages!1000!9!Up!Hangup!!!!!3!33754!!1580263771.180
-        out = subprocess.Popen(['asterisk', '-rx', 'core show channels concise'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-        stdout,stderr = out.communicate()
-
-        # Write to logger
-        if backLogger == True:
-            logger.info("DEBUG_TERMINATE_STATUS: Connected Channel List: %s" % (stdout))
-        # Print statement
         else:
-            print "DEBUG_TERMINATE_STATUS: Connected Channel List: %s" % (stdout)
+            # Sample reply:
+            # SIP/1002-0000007b!myphones!!1!Up!AppDial!(Outgoing Line)!1002!!!3!196!0377ef02-fcb0-490a-8231-53ed81fa9d4a!1580297330.202
+            # SIP/1001-0000007a!myphones!1002!1!Up!Dial!SIP/1002!1003!!!3!196!0377ef02-fcb0-490a-8231-53ed81fa9d4a!1580297330.200
+            # Message/ast_msg_queue!mychatmessages!1000!9!Up!Hangup!!!!!3!33754!!1580263771.180
+            stdout,stderr = runAstCommand('core show channels concise')
+
+            logInfo("DEBUG_TERMINATE_STATUS: Connected Channel List: %s", stdout)
+
+            # Full channel name is the first field of each channel line
+            chanList = [ chanLine.split('!', 1)[0] for chanLine in stdout.splitlines() ]
                     
         # NO error during asterisk command execution
         if stderr == None:
-            getChan = False
-            fullChan = ''
-            chan = stdout
             # Check request call channel for termination existence
             terminateChan = 'SIP/' + terminateChan 
+            # Get FULL dispatch channel info to be terminated
+            # Call channel format MUST be request channel name followed by '-' sign
+            chanPrefix = terminateChan + '-'
+            fullChan = ''
+            for chanName in chanList:
+                if chanName.startswith(chanPrefix):
+                    fullChan = chanName
+                    break
             # Dispatch call channel exist
-            if terminateChan in chan:
-                # Write to logger
-                if backLogger == True:
-                    logger.info("DEBUG_TERMINATE_STATUS: Call Channel [%s] exist" % (terminateChan))
-                 # Print statement
-                else:   
-                    print "DEBUG_TERMINATE_STATUS: Call Channel [%s] exist" % (terminateChan)
+            if fullChan != '':
+                logInfo("DEBUG_TERMINATE_STATUS: Call Channel [%s] exist", terminateChan)
+                logInfo("DEBUG_TERMINATE_STATUS: Full Call Channel Name: %s", fullChan)
+
+                # Request hangup via asterisk manager interface
+                if amiuser is not None:
+                    amiResp = amiAction([('Action', 'Hangup'), ('Channel', fullChan)])
+                    if amiResp is not None and amiResp[0].get('Response') == 'Success':
+                        stderr = None
+                    else:
+                        stderr = "AMI Hangup action failed"
+
+                    logInfo("DEBUG_TERMINATE_STATUS: Terminated Channel Message: %s", amiResp)
+
+                # Execute asterisk command via linux terminal
+                else:
+                    fullChan = 'channel request hangup ' + fullChan
+                    stdout,stderr = runAstCommand(fullChan)
+
+                    logInfo("DEBUG_TERMINATE_STATUS: Terminated Channel Message: %s", stdout)
                     
-                # Get FULL dispatch channel info to be terminated
-                chanIdLen = len(chan)
-                for b in range(0, chanIdLen + 1):
-                    oneChar = mid(chan, b, 1)
-                    # Indicate there is a dispatch call channel connected
-                    if oneChar == '/' and getChan == False:
-                        getChan = True
-                    # Retrieve full channel name
-                    elif getChan == True and oneChar != '!':
-                        fullChan += oneChar
-                    # End of full channel name
-                    elif getChan == True and oneChar == '!':
-                        # Check call channel format, MUST has '-' sign
-                        if '-' in fullChan:
-                            fullChan = 'SIP/' + fullChan
-
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_TERMINATE_STATUS: Full Call Channel Name: %s" % (fullChan))
-                            # Print statement
-                            else:       
-                                print "DEBUG_TERMINATE_STATUS: Full Call Channel Name: %s" % (fullChan)
-                                
-                            # Check against request channel name
-                            if terminateChan in fullChan:
-                                fullChan = 'channel request hangup ' + fullChan
-                                out = subprocess.Popen(['asterisk', '-rx', fullChan], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                stdout,stderr = out.communicate()
-
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_TERMINATE_STATUS: Terminated Channel Message: %s" % (stdout))
-                                # Print statement
-                                else:
-                                    print "DEBUG_TERMINATE_STATUS: Terminated Channel Message: %s" % (stdout)
-                                    
-                                if stderr == None:
-                                    # Write to logger
-                                    if backLogger == True:
-                                        logger.info("DEBUG_TERMINATE_STATUS: Terminate Dispatch Call Channel Successful")
-                                    # Print statement
-                                    else:
-                                        print "DEBUG_TERMINATE_STATUS: Terminate Dispatch Call Channel Successful"
-                                        
-                                    # Update call channel data
-                                    hgup[0]['status'] = 'TERMINATED' 
-                                    break
-                                else:
-                                    # Write to logger
-                                    if backLogger == True:
-                                        logger.info("DEBUG_TERMINATE_STATUS: Terminate Dispatch Call Channel Failed!")
-                                    # Print statement
-                                    else:
-                                        print "DEBUG_TERMINATE_STATUS: Terminate Dispatch Call Channel Failed!"
-
-                                    # Update call channel data
-                                    hgup[0]['status'] = 'ERROR' 
-                                    break
-                            else:
-                                fullChan = ''
-                        getChan = False
+                if stderr == None:
+                    logInfo("DEBUG_TERMINATE_STATUS: Terminate Dispatch Call Channel Successful")
+                        
+                    # Update call channel data
+                    hgup[0]['status'] = 'TERMINATED' 
+                else:
+                    logInfo("DEBUG_TERMINATE_STATUS: Terminate Dispatch Call Channel Failed!")
+
+                    # Update call channel data
+                    hgup[0]['status'] = 'ERROR' 
             # Dispatch call channel NOT exist    
             else:
-                # Write to logger
-                if backLogger == True:
-                    logger.info("DEBUG_TERMINATE_STATUS: Dispatch Call Channel NOT Exist!")
-                # Print statement
-                else:
-                    print "DEBUG_TERMINATE_STATUS: Dispatch Call Channel NOT Exist!"
+                logInfo("DEBUG_TERMINATE_STATUS: Dispatch Call Channel NOT Exist!")
                     
                 # Update call channel data
                 hgup[0]['status'] = 'ERROR'
         # Error during asterisk command execution 
         else:
-            # Write to logger
-            if backLogger == True:
-                logger.info("DEBUG_TERMINATE_STATUS: Error: %s" % (stderr))
-                logger.info("DEBUG_TERMINATE_STATUS: Error during asterisk command execution")    
-            # Print statement
-            else:
-                print "DEBUG_TERMINATE_STATUS: Error: %s" % (stderr)
-                print "DEBUG_TERMINATE_STATUS: Error during asterisk command execution"
+            logInfo("DEBUG_TERMINATE_STATUS: Error: %s", stderr)
+            logInfo("DEBUG_TERMINATE_STATUS: Error during asterisk command execution")
                      
             # Update call channel data
             hgup[0]['status'] = 'ERROR'
@@ -1741,84 +1470,82 @@ def terminateGivenCall(hgUpId):
     return jsonify({'CallStatusInfo': hgup}) 
 
 #Thread to delete audio recording file
-def deleteRecordingFile (threadname, delay):
-    global fileNeedToDelete
-    global fileToDeleteCnt   
-    global deleteProc
-    
+def deleteRecordingFile (threadname):
     fileToDelete = ''
     
     # Forever loop
     while True:
-        # Loop every 0.5s
-        time.sleep(delay)
-        
-        # Previously there is a request to delete maximum audio recording file
-        if deleteProc == True:
-            # Loop through the audio recording file delete buffer
-            for a in range(fileToDeleteCnt):
-                # Copy file detail name to the variable
-                fileToDelete = '/var/www/html/recordings/' + fileNeedToDelete[a]
-
-                # Start delete the recording file
-                tempArgs = 'rm -r ' + fileToDelete 
-                out = subprocess.Popen([tempArgs], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                stdout,stderr = out.communicate()
-                # NO error after command execution
-                if stderr == None:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_THD_REC_DELETE: Delete File: %s SUCCESFUL" % (fileNeedToDelete[a]))
-                    # Print statement
-                    else:
-                        print "DEBUG_THD_REC_DELETE: Delete File: %s SUCCESFUL" % (fileNeedToDelete[a])
+        # Wait until there is a request to delete maximum audio recording file
+        fileToDelete = deleteQueue.get()
 
-                # Error during command execution        
-                else:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_THD_REC_DELETE: Delete File: %s FAILED!" % (fileNeedToDelete[a]))
-                    # Print statement
-                    else:
-                        print "DEBUG_THD_REC_DELETE: Delete File: %s FAILED!" % (fileNeedToDelete[a])
-                        
-            # Empty delete buffer
-            fileNeedToDelete = []
-            # Reset buffer index counter
-            fileToDeleteCnt = 0
-            # Reset back recording flag
-            deleteProc = False
-            
-            # Write to logger
-            if backLogger == True:
-                logger.info("DEBUG_THD_REC_DELETE: Delete File: FINISHED")
-            # Print statement
-            else:
-                print "DEBUG_THD_REC_DELETE: Delete File: FINISHED" 
+        # Start delete the recording file
+        try:
+            os.unlink(fileToDelete)
+
+            logInfo("DEBUG_THD_REC_DELETE: Delete File: %s SUCCESFUL", os.path.basename(fileToDelete))
+
+        # Error during delete process
+        except OSError:
+            logInfo("DEBUG_THD_REC_DELETE: Delete File: %s FAILED!", os.path.basename(fileToDelete))
+
+        deleteQueue.task_done()
+
+        # Delete queue empty
+        if deleteQueue.unfinished_tasks == 0:
+            logInfo("DEBUG_THD_REC_DELETE: Delete File: FINISHED")
             
+#Thread to write XML file queued during REST API PUT request
+def writeXmlFile (threadname):
+    # Forever loop
+    while True:
+        # Wait until there is a request to write XML file
+        getElem, xmlFile = xmlWriteQueue.get()
+
+        try:
+            # Write the latest xml object contents, further update will queue the XML file again
+            # Hold xmlLock until the XML file is replaced, so an older xml object contents never overwrite a
+            # newer XML file written by get contact list
+            with xmlLock:
+                xmlWritePending.discard(xmlFile)
+                writeXml(getElem(), xmlFile)
+
+        # Any error MUST NOT stop the thread, otherwise no XML file are written anymore
+        except Exception as err:
+            logInfo("DEBUG_THD_XML_WRITE: Write File: %s FAILED! %s", os.path.basename(xmlFile), repr(err))
+
+        finally:
+            xmlWriteQueue.task_done()
+
 # Main daemon entry point             
 def main():
+    # Read XML files, and then update python dictionary data
+    loadXmlData()
+
     # Create thread to check PING signal from server
     try:
-        thread.start_new_thread(deleteRecordingFile, ("Create delete recording file thread", 5, ))
-    except:
-        # Write to logger
-        if backLogger == True:
-            # log events, when daemon run in background
-            logger.info("DEBUG_THD_REC_DELETE: Error: unable to start delete recording file thread")
-        # Print statement
-        else:
-            print "DEBUG_THD_REC_DELETE: Error: unable to start delete recording file thread"
+        deleteThd = threading.Thread(target=deleteRecordingFile, args=("Create delete recording file thread", ))
+        deleteThd.daemon = True
+        deleteThd.start()
+    except RuntimeError:
+        logInfo("DEBUG_THD_REC_DELETE: Error: unable to start delete recording file thread")
+
+    # Create thread to write XML file during REST API PUT request
+    try:
+        writeXmlThd = threading.Thread(target=writeXmlFile, args=("Create write XML file thread", ))
+        writeXmlThd.daemon = True
+        writeXmlThd.start()
+    except RuntimeError:
+        logInfo("DEBUG_THD_XML_WRITE: Error: unable to start write XML file thread")
             
     # Get current and latest call audio file 
     getRecordFile()
     
-    # Write to logger
-    if backLogger == True:
-        logger.info("DEBUG_REST_API: RestFul API web server STARTED")
-    # Print statement
-    else:
-        print "DEBUG_REST_API: RestFul API web server STARTED"
+    logInfo("DEBUG_REST_API: RestFul API web server STARTED")
+    # Daemon are also loaded during import by WSGI server (hangupserver:app), which run the RestFul API web server
+    # and handle HTTPS instead of SECURE macro, example command:
+    # HANGUPSERVER_ARGS="LOGGER XML" gunicorn -k gthread -w 1 --threads 8 -b 0.0.0.0:8000 --certfile fullchain.pem --keyfile ca.key hangupserver:app
+    # MUST only use a single worker process, call status and contact list data are kept inside the process memory,
+    # concurrent request are handled by the worker threads
     if __name__ == "__main__":
         if secureInSecure == True:
             # RUN RestFul API web server